@@ -0,0 +1,13 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from batch import base_d_many
+
+with open('Binary with a Twist/B3/B3.in', 'r') as infile, \
+     open('Binary with a Twist/B3/B3_SOL.txt', 'w') as outfile:
+     next(infile)
+     numbers = np.array([int(line) for line in infile if line.strip()], dtype=object)
+     outfile.write(''.join(f'{d}\n' for d in base_d_many(numbers).tolist()))
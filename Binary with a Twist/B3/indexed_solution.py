@@ -0,0 +1,13 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from base_index import base_d
+
+with open('Binary with a Twist/B3/B3.in', 'r') as infile, \
+     open('Binary with a Twist/B3/B3_SOL.txt', 'w') as outfile:
+     next(infile)
+     for line in infile:
+         number = int(line.strip())
+         d = base_d(number)
+         outfile.write(f'{d}' +'\n')
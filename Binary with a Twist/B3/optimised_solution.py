@@ -1,26 +1,8 @@
-def base_d(n):
-    if n <= 3:
-        return 3 if n != 2 else -1
-    
-    L = n.bit_length()
+import os
+import sys
 
-    for k in range(L-1, 1, -1):
-        d0 = int(round(n ** (1.0/k)))
-
-        for d in (d0-1, d0, d0+1):
-            if d <= 2 or d == n-1:
-                continue
-            temp = n
-            valid = True
-            while temp:
-                if temp % d > 1:
-                    valid = False
-                    break
-                temp //= d
-            if valid:
-                return d
-
-    return n - 1
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from base_search import base_d
 
 with open('Binary with a Twist/B3/B3.in', 'r') as infile, \
      open('Binary with a Twist/B3/B3_SOL.txt', 'w') as outfile:
@@ -28,4 +10,4 @@ with open('Binary with a Twist/B3/B3.in', 'r') as infile, \
      for line in infile:
          number = int(line.strip())
          d = base_d(number)
-         outfile.write(f'{d}' +'\n')
\ No newline at end of file
+         outfile.write(f'{d}' +'\n')
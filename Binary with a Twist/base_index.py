@@ -0,0 +1,145 @@
+import os
+import sys
+from math import isqrt
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from base_search import base_d as search_base_d, iroot
+
+INDEX_DIR = os.path.dirname(os.path.abspath(__file__))
+NUMBERS_PATH = os.path.join(INDEX_DIR, 'base_index_numbers.npy')
+BASES_PATH = os.path.join(INDEX_DIR, 'base_index_bases.npy')
+MAX_N = 10**18
+# Bases below 16 are tried directly: base 3 alone has 2^37 numbers of 0/1
+# digits below 10^18, base 16 only 2^14
+SMALL_BASES = range(3, 16)
+MIN_DIGITS = 5
+
+
+def build_index(max_n=MAX_N):
+    """
+    Every n <= max_n with at least MIN_DIGITS digits, all 0 or 1, in some base
+    d >= 16, with the smallest such d.
+
+    For each base the numbers with k+1 digits are d^k plus every subset sum
+    of d^0 .. d^(k-1), grown one digit at a time. Returns the numbers sorted
+    (uint64) and their bases (uint32).
+    """
+    numbers, bases = [], []
+    top = iroot(max_n, MIN_DIGITS - 1)
+    for d in range(SMALL_BASES.stop, top + 1):
+        sums = np.zeros(1, dtype=np.uint64)
+        power = 1
+        for k in range(1, max_n.bit_length()):
+            sums = np.concatenate((sums, sums + np.uint64(power)))
+            power *= d
+            if power > max_n:
+                break
+            if k + 1 < MIN_DIGITS:
+                continue
+            values = sums + np.uint64(power)
+            values = values[values <= np.uint64(max_n)]
+            numbers.append(values)
+            bases.append(np.full(len(values), d, dtype=np.uint32))
+    numbers = np.concatenate(numbers)
+    bases = np.concatenate(bases)
+    # Smallest base first within equal numbers, then keep the first of each
+    order = np.lexsort((bases, numbers))
+    numbers, bases = numbers[order], bases[order]
+    first = np.ones(len(numbers), dtype=bool)
+    first[1:] = numbers[1:] != numbers[:-1]
+    return numbers[first], bases[first]
+
+
+class BaseIndex:
+    """
+    The build_index arrays for n <= 10^18, stored as two .npy files.
+
+    Built and saved the first time it is needed, then memory-mapped, so a
+    run only touches the pages its binary searches land on. On load the
+    numbers must be strictly increasing and every base in range.
+    """
+    def __init__(self, numbers_path=NUMBERS_PATH, bases_path=BASES_PATH):
+        self.numbers_path = numbers_path
+        self.bases_path = bases_path
+        self.numbers = None
+        self.bases = None
+
+    def load(self):
+        if not (os.path.exists(self.numbers_path) and os.path.exists(self.bases_path)):
+            self.numbers, self.bases = build_index()
+            self.save()
+        numbers = np.load(self.numbers_path, mmap_mode='r')
+        bases = np.load(self.bases_path, mmap_mode='r')
+        if numbers.shape != bases.shape or numbers.dtype != np.uint64:
+            raise ValueError(f"Base index has shapes {numbers.shape} and {bases.shape}!")
+        if len(numbers) and not (np.all(numbers[1:] > numbers[:-1])
+                                 and bases.min() >= SMALL_BASES.stop
+                                 and bases.max() <= iroot(MAX_N, MIN_DIGITS - 1)):
+            raise ValueError("Base index is not sorted or has a base out of range!")
+        self.numbers, self.bases = numbers, bases
+
+    def save(self):
+        np.save(self.numbers_path, self.numbers)
+        np.save(self.bases_path, self.bases)
+
+    def lookup(self, n):
+        """Smallest indexed base of n, None if n has no 0/1 form with 5+ digits in base >= 16."""
+        if self.numbers is None:
+            self.load()
+        key = np.uint64(n)
+        i = int(np.searchsorted(self.numbers, key))
+        if i < len(self.numbers) and self.numbers[i] == key:
+            return int(self.bases[i])
+        return None
+
+
+INDEX = BaseIndex()
+
+
+def base_d(n, index=INDEX):
+    """
+    Smallest base d > 2 in which n has only digits 0 and 1, -1 if none.
+
+    Bases come in digit-count order, so they are tried smallest first: the
+    bases below 16 directly, 5+ digits from the index, then 4, 3 and 2
+    digits analytically. With k+1 digits the base can only be iroot(n, k)
+    (see base_search), so 4 digits is one cube root and 3 digits one isqrt.
+    Above MAX_N the index does not apply and base_search takes over.
+    """
+    if n <= 3:
+        return 3 if n != 2 else -1
+    if n > MAX_N:
+        return search_base_d(n)
+    for d in SMALL_BASES:
+        rest = n
+        while rest:
+            if rest % d > 1:
+                break
+            rest //= d
+        else:
+            return d
+    d = index.lookup(n)
+    if d is not None:
+        return d
+    # 4 digits: n = d^3 + a d^2 + b d + c
+    d = iroot(n, 3)
+    if d >= SMALL_BASES.stop:
+        rest = n - d ** 3
+        if rest < d ** 3 and rest // (d * d) <= 1 and rest // d % d <= 1 and rest % d <= 1:
+            return d
+    # 3 digits: n = d^2 + b d + c
+    d = isqrt(n)
+    if d >= SMALL_BASES.stop and n - d * d in (0, 1, d, d + 1):
+        return d
+    # 2 digits: n = d + 1
+    return n - 1
+
+
+if __name__ == '__main__':
+    index = BaseIndex()
+    index.numbers, index.bases = build_index()
+    index.save()
+    size = index.numbers.nbytes + index.bases.nbytes
+    print(f'{len(index.numbers)} numbers indexed ({size / 2**20:.1f} MiB), written to {NUMBERS_PATH}')
@@ -0,0 +1,160 @@
+import math
+
+
+def iroot(n, k):
+    """Largest r with r**k <= n, by Newton's method on integers."""
+    if n < 2:
+        return n
+    # Any positive start will do: one integer Newton step never lands below
+    # the root (AM-GM), and from there the steps only go down. A start close
+    # to the root keeps the number of big divisions small. Past the float
+    # range the root comes from the top 64 bits and the exponent
+    bits = n.bit_length()
+    if bits < 1000:
+        r = int(n ** (1.0 / k)) + 1
+    else:
+        shift = bits - 64
+        x = (math.log2(n >> shift) + shift) / k
+        low = max(0, int(x) - 60)
+        r = (int(2 ** (x - low)) + 1) << low
+    r = ((k - 1) * r + n // r ** (k - 1)) // k
+    while True:
+        s = ((k - 1) * r + n // r ** (k - 1)) // k
+        if s >= r:
+            return r
+        r = s
+
+def is_binary(n, d):
+    """True if every base-d digit of n is 0 or 1, stopping at the first that is not."""
+    while n:
+        if n % d > 1:
+            return False
+        n //= d
+    return True
+
+
+def base_d(n):
+    """
+    Smallest base d > 2 in which n only has the digits 0 and 1, -1 if there is none.
+
+    Small bases are tried directly, up to a limit that grows with the size
+    of n: a remainder test is far cheaper than a k-th root, and for small d
+    most k would give the same root anyway. Beyond the limit, with k+1
+    digits in base d, d**k <= n <= 1 + d + ... + d**k < (d+1)**k (for
+    k >= 2 the binomial expansion of (d+1)**k has every d**j with a
+    coefficient of at least 1, and k on d**(k-1)), so the only possible
+    base is iroot(n, k). Its top digit n // d**k must be 1, which
+    rejects most candidates before the digit loop. k runs downwards, i.e.
+    the bases upwards, so the first hit is the smallest base. Everything is
+    integer arithmetic, so n can have any number of digits.
+    """
+    if n <= 3:
+        return 3 if n != 2 else -1
+
+    bits = n.bit_length()
+    limit = max(32, bits // 4)
+    for d in range(3, limit):
+        if is_binary(n, d):
+            return d
+    # Largest k with limit**k <= n: every larger k has a root below the limit
+    top = int(bits / math.log2(limit)) + 1
+    while limit ** top > n:
+        top -= 1
+    for k in range(top, 1, -1):
+        d = iroot(n, k)
+        power = d ** k
+        rest = n - power
+        if rest < power and is_binary(rest, d):
+            return d
+
+    return n - 1
+
+
+def first_reaching(f, n, low, high):
+    """
+    Smallest d in [low, high] with f(d) >= n for an increasing f, high + 1 if none.
+
+    The answer is usually within a few steps of high, so the search gallops
+    down from there and only bisects the last bracket.
+    """
+    if high < low or f(high) < n:
+        return high + 1
+    top, step = high, 1
+    while True:
+        d = top - step
+        if d < low:
+            bottom = low - 1
+            break
+        if f(d) < n:
+            bottom = d
+            break
+        top, step = d, step * 2
+    # f(top) >= n, and f(bottom) < n or bottom is below the range
+    while top - bottom > 1:
+        d = (top + bottom) // 2
+        if f(d) >= n:
+            top = d
+        else:
+            bottom = d
+    return top
+
+
+def base_d_digits(n, digits):
+    """
+    Smallest base d > 2 in which every digit of n is in `digits`, -1 if there is none.
+
+    Digits must be below the base, so d starts above max(digits). As in
+    base_d, small bases are tried directly and the rest go by digit count,
+    k downwards. With k+1 digits, leading digit a and S = (d^k - 1) / (d - 1),
+    n lies between a*d^k + min(digits)*S and a*d^k + max(digits)*S. Both
+    ends grow with d, so two binary searches give the interval of bases
+    with leading digit a. For large d it is about
+    (max - min) / (a*k) bases wide, and only those are tested. A number that
+    is itself a digit is one digit long in any base above it. The 0/1
+    alphabet goes straight to base_d.
+    """
+    allowed = frozenset(digits)
+    if allowed == {0, 1}:
+        return base_d(n)
+    low_base = max(3, max(allowed) + 1)
+    if n == 0:
+        # Written as a single 0 in every base
+        return low_base if 0 in allowed else -1
+    leading = sorted((a for a in allowed if a), reverse=True)
+    smallest, largest = min(allowed), max(allowed)
+
+    def fits(d):
+        rest = n
+        while rest:
+            if rest % d not in allowed:
+                return False
+            rest //= d
+        return True
+
+    limit = max(low_base, 32, n.bit_length() // 4)
+    for d in range(low_base, min(limit, n + 1)):
+        if fits(d):
+            return d
+
+    if leading and n >= leading[-1] * limit:
+        # Largest k with min(leading) * limit**k <= n
+        top = int(n.bit_length() / math.log2(limit)) + 1
+        while leading[-1] * limit ** top > n:
+            top -= 1
+        for k in range(top, 0, -1):
+            # Larger leading digits mean smaller bases
+            for a in leading:
+                high = iroot(n // a, k)
+                if high < limit:
+                    continue
+                first = first_reaching(lambda d: a * d ** k + largest * ((d ** k - 1) // (d - 1)),
+                                       n, limit, high)
+                last = first_reaching(lambda d: a * d ** k + smallest * ((d ** k - 1) // (d - 1)),
+                                      n + 1, first, high) - 1
+                for d in range(first, last + 1):
+                    if fits(d):
+                        return d
+
+    if n in allowed:
+        return max(low_base, n + 1)
+    return -1
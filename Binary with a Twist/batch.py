@@ -0,0 +1,86 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from base_search import base_d
+
+# Largest n the uint64 path handles: powers saturate at 2^63, which is above
+# every n it sees, so no comparison can wrap
+SAFE_N = 2**62
+SATURATED = np.uint64(2**63)
+# 3^39 > SAFE_N, so no safe n has more than 39 digits past the top one
+MAX_K = 39
+
+
+def saturating_power(d, k):
+    """d**k elementwise for uint64 d, clamped to SATURATED instead of wrapping."""
+    power = np.ones_like(d)
+    cap = SATURATED // d
+    for _ in range(k):
+        power = np.where(power > cap, SATURATED, power * d)
+    return power
+
+
+def iroot_many(ns, k):
+    """Elementwise iroot(n, k) for uint64 n <= SAFE_N."""
+    # The float root is within one of the true root; one exact step each way fixes it
+    d = np.floor(np.power(ns.astype(np.float64), 1.0 / k)).astype(np.uint64)
+    d -= (saturating_power(d, k) > ns).astype(np.uint64)
+    d += (saturating_power(d + np.uint64(1), k) <= ns).astype(np.uint64)
+    return d
+
+
+def base_d_many(ns):
+    """
+    base_d for a whole array of queries at once.
+
+    Same search as base_search.base_d, run over the batch one digit count k
+    at a time, from MAX_K down to 2: every unanswered n gets its candidate
+    iroot(n, k), the top-digit test drops most of them, and the rest peel
+    off one digit per divmod pass until their remainder hits 0 (a hit) or a
+    digit above 1 (a miss). Hits are final, since larger k means smaller
+    bases. Whatever is left has the 2-digit answer n - 1.
+    Values above SAFE_N go through the scalar base_d, one by one.
+    Returns int64, or object if a big value needs a bigger answer.
+    """
+    ns = np.asarray(ns)
+    if ns.dtype == object:
+        big = np.array([int(n) > SAFE_N for n in ns], dtype=bool)
+    else:
+        big = ns > SAFE_N
+    small = ns[~big].astype(np.uint64)
+
+    answer = small.astype(np.int64) - 1
+    answer[small <= 3] = 3
+    answer[small == 2] = -1
+    solved = np.zeros(len(small), dtype=bool)
+    open_ = np.flatnonzero(small > 3)
+    for k in range(MAX_K, 1, -1):
+        # n < 3^k would need a base below 3
+        tried = open_[small[open_] >= np.uint64(3 ** k)]
+        if not len(tried):
+            continue
+        n = small[tried]
+        d = iroot_many(n, k)
+        power = saturating_power(d, k)
+        rest = n - power
+        alive = np.flatnonzero(rest < power)
+        rest, d = rest[alive], d[alive]
+        while len(alive):
+            rest, digit = np.divmod(rest, d)
+            keep = digit <= 1
+            alive, rest, d = alive[keep], rest[keep], d[keep]
+            done = rest == 0
+            answer[tried[alive[done]]] = d[done]
+            solved[tried[alive[done]]] = True
+            alive, rest, d = alive[~done], rest[~done], d[~done]
+        open_ = open_[~solved[open_]]
+
+    if not big.any():
+        return answer
+    result = np.empty(len(ns), dtype=object)
+    result[~big] = answer.tolist()
+    result[big] = [base_d(int(n)) for n in ns[big]]
+    return result
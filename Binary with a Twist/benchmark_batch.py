@@ -0,0 +1,28 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from base_search import base_d
+from batch import base_d_many
+
+print(f'{"input":>6} {"scalar s":>9} {"batch s":>8} {"speedup":>8}')
+for task in ('B1', 'B2', 'B3'):
+    with open(f'Binary with a Twist/{task}/{task}.in', 'r') as infile:
+        next(infile)
+        numbers = [int(line) for line in infile if line.strip()]
+    with open(f'Binary with a Twist/{task}/{task}_SOL.txt', 'r') as solfile:
+        expected = [int(line) for line in solfile]
+
+    start = time.perf_counter()
+    scalar = [base_d(n) for n in numbers]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = base_d_many(np.array(numbers, dtype=np.uint64)).tolist()
+    batch_time = time.perf_counter() - start
+
+    assert scalar == expected and batch == expected, f'{task} answers differ from {task}_SOL.txt'
+    print(f'{task:>6} {scalar_time:>9.3f} {batch_time:>8.3f} {scalar_time / batch_time:>7.1f}x')
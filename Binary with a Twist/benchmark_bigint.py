@@ -0,0 +1,62 @@
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from base_search import base_d, is_binary
+
+
+def previous_iroot(n, k):
+    # The first integer engine: float start below 1000 bits, else 2**ceil(bits/k)
+    if n < 2:
+        return n
+    if n.bit_length() < 1000:
+        r = int(n ** (1.0 / k) * (1 + 1e-12)) + 2
+    else:
+        r = 1 << -(-n.bit_length() // k)
+    while True:
+        s = ((k - 1) * r + n // r ** (k - 1)) // k
+        if s >= r:
+            return r
+        r = s
+
+
+def previous_base_d(n):
+    if n <= 3:
+        return 3 if n != 2 else -1
+    top = n.bit_length() * 100 // 158
+    while 3 ** top > n:
+        top -= 1
+    for k in range(top, 1, -1):
+        d = previous_iroot(n, k)
+        power = d ** k
+        rest = n - power
+        if rest < power and is_binary(rest, d):
+            return d
+    return n - 1
+
+
+def planted(digits, d):
+    """A number of about `digits` decimal digits that is 0/1 in base d."""
+    k = max(2, int((digits - 1) / math.log10(d)))
+    return d ** k + sum(random.randint(0, 1) * d ** j for j in range(k))
+
+
+random.seed(2024)
+print(f'{"digits":>6} {"inputs":>8} {"previous ms":>12} {"current ms":>11}')
+for digits in (100, 500, 1000):
+    cases = {
+        'random': [random.randrange(10 ** (digits - 1), 10 ** digits) for _ in range(5)],
+        'planted': [planted(digits, d) for d in (3, 7, 1000, 10**6, 10**20, 10**(digits // 3))],
+    }
+    for name, numbers in cases.items():
+        start = time.perf_counter()
+        expected = [previous_base_d(n) for n in numbers]
+        previous_time = (time.perf_counter() - start) / len(numbers)
+        start = time.perf_counter()
+        answers = [base_d(n) for n in numbers]
+        current_time = (time.perf_counter() - start) / len(numbers)
+        assert answers == expected, f'engines disagree on {digits}-digit {name} inputs'
+        print(f'{digits:>6} {name:>8} {previous_time * 1e3:>12.2f} {current_time * 1e3:>11.2f}')
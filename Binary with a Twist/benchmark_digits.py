@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+from math import isqrt
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from base_search import base_d_digits
+
+DIGIT_SETS = ((0, 1), (0, 1, 2), (0, 9), (1, 2))
+SAMPLE = 200
+
+
+def brute_force(n, digits):
+    # B1-style loop over every base up to sqrt(n), then the 2- and 1-digit forms
+    allowed = set(digits)
+    low_base = max(3, max(allowed) + 1)
+    if n == 0:
+        return low_base if 0 in allowed else -1
+    for d in range(low_base, isqrt(n) + 1):
+        rest = n
+        while rest:
+            if rest % d not in allowed:
+                break
+            rest //= d
+        else:
+            return d
+    # n = a*d + b with d > sqrt(n): the smallest d wins
+    two_digit = [(n - b) // a for a in allowed if a for b in allowed
+                 if (n - b) % a == 0 and (n - b) // a > max(low_base - 1, a, b, isqrt(n))]
+    if two_digit:
+        return min(two_digit)
+    if n in allowed:
+        return max(low_base, n + 1)
+    return -1
+
+
+with open('Binary with a Twist/B2/B2.in', 'r') as infile:
+    next(infile)
+    numbers = [int(line) for line in infile if line.strip()]
+
+print(f'{"digits":>14} {"brute us":>9} {"engine us":>10}')
+for digits in DIGIT_SETS:
+    sample = numbers[:SAMPLE]
+    start = time.perf_counter()
+    expected = [brute_force(n, digits) for n in sample]
+    brute_time = (time.perf_counter() - start) / len(sample)
+    assert [base_d_digits(n, digits) for n in sample] == expected, f'engine disagrees for {digits}'
+    start = time.perf_counter()
+    for n in numbers:
+        base_d_digits(n, digits)
+    engine_time = (time.perf_counter() - start) / len(numbers)
+    print(f'{str(digits):>14} {brute_time * 1e6:>9.0f} {engine_time * 1e6:>10.1f}')
@@ -0,0 +1,26 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from base_index import BaseIndex, base_d
+from base_search import base_d as search_base_d
+
+start = time.perf_counter()
+index = BaseIndex()
+index.load()
+print(f'index mapped and checked in {time.perf_counter() - start:.3f}s ({len(index.numbers)} numbers)')
+
+print(f'{"input":>6} {"engine":>7} {"total s":>8} {"mean us":>8}')
+for task in ('B2', 'B3'):
+    with open(f'Binary with a Twist/{task}/{task}.in', 'r') as infile:
+        next(infile)
+        numbers = [int(line) for line in infile if line.strip()]
+    with open(f'Binary with a Twist/{task}/{task}_SOL.txt', 'r') as solfile:
+        expected = [int(line) for line in solfile]
+    for name, engine in (('iroot', search_base_d), ('index', lambda n: base_d(n, index))):
+        start = time.perf_counter()
+        answers = [engine(n) for n in numbers]
+        total = time.perf_counter() - start
+        assert answers == expected, f'{name} disagrees with {task}_SOL.txt'
+        print(f'{task:>6} {name:>7} {total:>8.3f} {total / len(numbers) * 1e6:>8.1f}')
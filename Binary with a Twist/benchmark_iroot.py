@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from base_search import base_d
+
+
+def float_base_d(n):
+    # The previous B3 engine: float root estimate and three neighbours per k
+    if n <= 3:
+        return 3 if n != 2 else -1
+
+    L = n.bit_length()
+
+    for k in range(L-1, 1, -1):
+        d0 = int(round(n ** (1.0/k)))
+
+        for d in (d0-1, d0, d0+1):
+            if d <= 2 or d == n-1:
+                continue
+            temp = n
+            valid = True
+            while temp:
+                if temp % d > 1:
+                    valid = False
+                    break
+                temp //= d
+            if valid:
+                return d
+
+    return n - 1
+
+
+def per_query(engine, numbers):
+    times = []
+    answers = []
+    for n in numbers:
+        start = time.perf_counter()
+        answers.append(engine(n))
+        times.append(time.perf_counter() - start)
+    return answers, times
+
+
+with open('Binary with a Twist/B3/B3.in', 'r') as infile:
+    next(infile)
+    numbers = [int(line) for line in infile if line.strip()]
+
+results = {}
+print(f'{"engine":>7} {"total s":>8} {"mean us":>8} {"p99 us":>8} {"max us":>8}')
+for name, engine in (('float', float_base_d), ('iroot', base_d)):
+    answers, times = per_query(engine, numbers)
+    results[name] = answers
+    times.sort()
+    total = sum(times)
+    print(f'{name:>7} {total:>8.3f} {total / len(times) * 1e6:>8.1f} '
+          f'{times[len(times) * 99 // 100] * 1e6:>8.1f} {times[-1] * 1e6:>8.1f}')
+print(f'answers differ on {sum(a != b for a, b in zip(results["float"], results["iroot"]))} queries')
@@ -0,0 +1,32 @@
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from batch import base_d_many
+from sieve import base_d_range
+
+WINDOW = 10**6
+
+print(f'{"range":>42} {"sieve s":>8} {"batch s":>8} {"peak MiB":>9}')
+for lo, hi in ((1, 10**8), (10**12, 10**12 + 10**8), (10**17, 10**17 + 10**8)):
+    tracemalloc.start()
+    start = time.perf_counter()
+    checked = False
+    for chunk_start, answer in base_d_range(lo, hi - 1):
+        if not checked:
+            # The batch solver is far slower, so it only checks the first window
+            batch_start = time.perf_counter()
+            expected = base_d_many(np.arange(chunk_start, chunk_start + WINDOW, dtype=np.uint64))
+            batch_time = time.perf_counter() - batch_start
+            assert np.array_equal(answer[:WINDOW], expected), f'sieve differs from base_d_many at {chunk_start}'
+            checked = True
+            tracemalloc.reset_peak()
+    sieve_time = time.perf_counter() - start - batch_time
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    print(f'{f"[{lo}, {hi})":>42} {sieve_time:>8.2f} {batch_time * (hi - lo) / WINDOW:>7.0f}* {peak:>9.1f}')
+print('* batch time extrapolated from its first window of 10^6')
@@ -0,0 +1,121 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from base_search import iroot
+from batch import SAFE_N
+
+CHUNK = 1 << 20
+# Above this many (base, pattern) pairs a digit count is walked base by base
+PAIR_BUDGET = 1 << 16
+
+
+def patterns_below(d, k, y):
+    """How many k-digit 0/1 strings read in base d are below y."""
+    if y <= 0:
+        return 0
+    if y >= d ** k:
+        return 1 << k
+    count = 0
+    for j in range(k - 1, -1, -1):
+        digit = y // d ** j % d
+        if digit > 1:
+            return count + (2 << j)
+        if digit == 1:
+            count += 1 << j
+    return count
+
+
+def first_base(lo, k):
+    """Smallest base d >= 3 whose largest (k+1)-digit 0/1 number, d^k + ... + 1, is >= lo."""
+    low, high = max(3, iroot(lo * 2 // 3, k) + 1), max(3, iroot(lo, k) + 1)
+    while low < high:
+        d = (low + high) // 2
+        if d ** k + (d ** k - 1) // (d - 1) >= lo:
+            high = d
+        else:
+            low = d + 1
+    return low
+
+
+def pattern_values(patterns, powers):
+    """Value of every 0/1 pattern (rows) against every power vector (columns)."""
+    values = np.zeros((len(patterns), powers.shape[1]), dtype=np.uint64)
+    for j in range(powers.shape[0]):
+        values += ((patterns >> np.uint64(j)) & np.uint64(1))[:, None] * powers[j]
+    return values
+
+
+def sieve_chunk(lo, hi):
+    """
+    Smallest base for every n in [lo, hi), as int64.
+
+    Every base with three or more digits is at most sqrt(n), so the sieve
+    goes over digit counts k + 1 = 3, 4, ... and, for each, the bases d
+    whose (k+1)-digit span d^k .. d^k + d^(k-1) + ... + 1 meets [lo, hi). The 0/1 numbers of base d with
+    k + 1 digits are d^k plus the subset sums of d^0 .. d^(k-1), in the
+    same order as their bit patterns. When bases times patterns is small they
+    are all generated in one array; otherwise only the pattern range that
+    lands in the chunk is generated, base by base. Each slot keeps the
+    smallest base marked in it. Unmarked slots get n - 1, with -1 for 2 and
+    3 for 0, 1 and 3, as in base_d.
+    """
+    size = hi - lo
+    best = np.full(size, np.iinfo(np.int64).max, dtype=np.int64)
+    k = 2
+    while 3 ** k < hi:
+        # Bases whose (k+1)-digit numbers, d^k .. d^k + ... + 1, reach the chunk
+        first = first_base(lo, k)
+        last = iroot(hi - 1, k)
+        if first <= last:
+            if (last - first + 1) << k <= PAIR_BUDGET:
+                bases = np.arange(first, last + 1, dtype=np.uint64)
+                powers = np.array([bases ** np.uint64(j) for j in range(k + 1)])
+                patterns = np.arange(1 << k, dtype=np.uint64) | np.uint64(1 << k)
+                values = pattern_values(patterns, powers)
+                marked = (values >= np.uint64(lo)) & (values < np.uint64(hi))
+                columns = np.broadcast_to(bases.astype(np.int64), values.shape)
+                np.minimum.at(best, (values[marked] - np.uint64(lo)).astype(np.int64), columns[marked])
+            else:
+                for d in range(first, last + 1):
+                    top = d ** k
+                    start = patterns_below(d, k, lo - top)
+                    stop = patterns_below(d, k, hi - top)
+                    if start == stop:
+                        continue
+                    patterns = np.arange(start, stop, dtype=np.uint64) | np.uint64(1 << k)
+                    powers = np.array([[d ** j] for j in range(k + 1)], dtype=np.uint64)
+                    values = pattern_values(patterns, powers)[:, 0]
+                    np.minimum.at(best, (values - np.uint64(lo)).astype(np.int64), d)
+        k += 1
+
+    numbers = np.arange(lo, hi, dtype=np.int64)
+    answer = np.where(best == np.iinfo(np.int64).max, numbers - 1, best)
+    answer[numbers <= 3] = 3
+    answer[numbers == 2] = -1
+    return answer
+
+
+def base_d_range(lo, hi, chunk=CHUNK):
+    """
+    Minimum bases for every n in [lo, hi], yielded as (start, array) chunks.
+
+    Only one chunk of results exists at a time, so ranges of 10^8 and more
+    run in bounded memory. hi is at most SAFE_N.
+    """
+    if lo < 0 or hi > SAFE_N:
+        raise ValueError(f"Range [{lo}, {hi}] is outside 0..{SAFE_N}!")
+    for start in range(lo, hi + 1, chunk):
+        yield start, sieve_chunk(start, min(start + chunk, hi + 1))
+
+
+if __name__ == '__main__':
+    import time
+
+    start = time.perf_counter()
+    count = 0
+    for chunk_start, answer in base_d_range(1, 10**7):
+        count += len(answer)
+    print(f'{count} minimum bases in {time.perf_counter() - start:.2f}s')
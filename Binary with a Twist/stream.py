@@ -0,0 +1,90 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from batch import base_d_many
+
+CHUNK = 1 << 20
+WRITE_BUFFER = 1 << 22
+# 10^19 - 1 still fits a uint64; longer numbers are parsed one by one
+MAX_DIGITS = 19
+POWERS_OF_10 = np.array([10**p for p in range(MAX_DIGITS)], dtype=np.uint64)
+
+
+def parse_numbers(data):
+    """
+    Every decimal number in a bytes buffer, as uint64 (object if any has more than 19 digits).
+
+    The buffer is viewed as a uint8 array: runs of digit bytes are the
+    numbers, each digit is weighted by 10^(its distance from the end of its
+    run) and the runs are summed with reduceat, so no per-line bytes or str
+    objects are made.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    digit = (buf >= 48) & (buf <= 57)
+    edges = np.diff(digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not len(starts):
+        return np.zeros(0, dtype=np.uint64)
+    lengths = ends - starts
+    if lengths.max() > MAX_DIGITS:
+        return np.array([int(data[s:e]) for s, e in zip(starts.tolist(), ends.tolist())], dtype=object)
+
+    values = (buf[digit] - 48).astype(np.uint64)
+    # Distance of every digit from the last digit of its number
+    offsets = np.cumsum(lengths) - lengths
+    place = np.repeat(offsets + lengths - 1, lengths) - np.arange(len(values))
+    values *= POWERS_OF_10[place]
+    return np.add.reduceat(values, offsets)
+
+
+def solve_stream(infile, outfile, chunk=CHUNK):
+    """
+    Answer every query of a binary input stream (t first, then one n per line).
+
+    The input is read `chunk` bytes at a time. A number cut off at the end of
+    a chunk is carried over to the next. Each chunk is one batch for
+    base_d_many, and its answers go out as a single write. Memory depends on
+    the chunk size only, never on t. Returns the number of queries answered.
+    """
+    count = 0
+    carry = b''
+    header = True
+    while True:
+        data = infile.read(chunk)
+        last = not data
+        data = carry + data
+        if not last:
+            # Keep back the trailing number, which may continue in the next chunk
+            cut = len(data)
+            while cut and 48 <= data[cut - 1] <= 57:
+                cut -= 1
+            if not cut:
+                carry = data
+                continue
+            data, carry = data[:cut], data[cut:]
+        numbers = parse_numbers(data)
+        if header and len(numbers):
+            numbers, header = numbers[1:], False
+        if len(numbers):
+            answers = base_d_many(numbers).tolist()
+            outfile.write('\n'.join(map(str, answers)).encode() + b'\n')
+            count += len(answers)
+        if last:
+            return count
+
+
+if __name__ == '__main__':
+    # python stream.py [input [output]], stdin and stdout by default
+    infile = open(sys.argv[1], 'rb') if len(sys.argv) > 1 else sys.stdin.buffer
+    outfile = open(sys.argv[2], 'wb', buffering=WRITE_BUFFER) if len(sys.argv) > 2 \
+        else open(sys.stdout.fileno(), 'wb', buffering=WRITE_BUFFER, closefd=False)
+    start = time.perf_counter()
+    with infile, outfile:
+        count = solve_stream(infile, outfile)
+    elapsed = time.perf_counter() - start
+    print(f'{count} queries in {elapsed:.2f}s, {count / elapsed:.0f} queries/s', file=sys.stderr)
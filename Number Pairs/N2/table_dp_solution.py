@@ -0,0 +1,17 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from table_dp import find_pair_table_dp
+
+with open('Number Pairs/N2/N2.in', 'r') as infile, \
+     open('Number Pairs/N2/N2_TABLE_DP.txt', 'w') as outfile:
+    next(infile)
+    for line in infile:
+        number = int(line.strip())
+        result = find_pair_table_dp(number)
+        if result:
+            a, b = result
+            outfile.write(f'{a} {b}\n')
+        else:
+            outfile.write('NONE' + '\n')
@@ -0,0 +1,17 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from min_pair import find_min_pair
+
+with open('Number Pairs/N3/N3.in', 'r') as infile, \
+     open('Number Pairs/N3/N3_MIN.txt', 'w') as outfile:
+    next(infile)
+    for line in infile:
+        number = int(line.strip())
+        result = find_min_pair(number)
+        if result:
+            a, b = result
+            outfile.write(f'{a} {b}\n')
+        else:
+            outfile.write('NONE' + '\n')
@@ -0,0 +1,33 @@
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from constructive import build_pair
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'N3', 'digit_dp.py')) as f:
+    source = f.read()
+exec(source[:source.index('with open(')])
+
+MAX_D = 10**18
+COUNT = 10**6
+DP_SAMPLE = 2000
+
+random.seed(7)
+print(f'{"d":>14} {"DP per s":>10} {"built per s":>12}')
+for name, draw in (('random', lambda: random.randint(1, MAX_D)),
+                   ('multiple of 9', lambda: 9 * random.randint(1, MAX_D // 9))):
+    numbers = [draw() for _ in range(COUNT)]
+
+    start = time.perf_counter()
+    for d in numbers[:DP_SAMPLE]:
+        find_pair_digit_dp(d)
+    dp_rate = DP_SAMPLE / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for d in numbers:
+        build_pair(d)
+    rate = COUNT / (time.perf_counter() - start)
+    print(f'{name:>14} {dp_rate:>10.0f} {rate:>12.0f}')
+print(f'DP measured on the first {DP_SAMPLE} of each {COUNT} d')
@@ -0,0 +1,46 @@
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from constructive import digit_sum
+from min_pair import find_min_pair
+from table_dp import find_pair_table_dp
+
+BRUTE_LIMIT = 20000
+
+# Smallest x by plain enumeration, for every d up to BRUTE_LIMIT
+start = time.perf_counter()
+for d in range(BRUTE_LIMIT + 1):
+    pair = find_min_pair(d)
+    if d % 9:
+        assert pair is None, d
+        continue
+    x = 0
+    while digit_sum(x) != digit_sum(x + d):
+        x += 1
+    assert pair == (x, x + d), (d, pair, x)
+print(f'smallest x matches enumeration for every d <= {BRUTE_LIMIT} ({time.perf_counter() - start:.1f}s)')
+
+with open('Number Pairs/N3/N3.in', 'r') as infile:
+    next(infile)
+    n3 = [int(line) for line in infile if line.strip()]
+random.seed(13)
+inputs = {'N3': n3, '9 | d <= 1e18': [9 * random.randint(1, 10**18 // 9) for _ in range(2000)]}
+
+print(f'{"inputs":>14} {"first-found s":>14} {"minimal s":>10} {"first x digits":>15} {"min x digits":>13}')
+for name, numbers in inputs.items():
+    results = []
+    for engine in (find_pair_table_dp, find_min_pair):
+        start = time.perf_counter()
+        pairs = [engine(d) for d in numbers]
+        elapsed = time.perf_counter() - start
+        found = [pair for pair in pairs if pair]
+        for d, pair in zip(numbers, pairs):
+            if pair:
+                assert pair[1] - pair[0] == d and digit_sum(pair[0]) == digit_sum(pair[1])
+        results.append((elapsed, sum(len(str(x)) for x, y in found) / max(1, len(found)), pairs))
+    (first_time, first_digits, first), (min_time, min_digits, minimal) = results
+    assert all((a is None) == (b is None) and (a is None or b[0] <= a[0]) for a, b in zip(first, minimal))
+    print(f'{name:>14} {first_time:>14.3f} {min_time:>10.3f} {first_digits:>15.1f} {min_digits:>13.1f}')
@@ -0,0 +1,45 @@
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from table_dp import find_pair_table_dp
+
+# The recursive digit DP, without its file loop
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'N3', 'digit_dp.py')) as f:
+    source = f.read()
+exec(source[:source.index('with open(')])
+
+
+def load(task):
+    with open(f'Number Pairs/{task}/{task}.in', 'r') as infile:
+        next(infile)
+        return [int(line) for line in infile if line.strip()]
+
+
+random.seed(11)
+inputs = {
+    'N2': load('N2'),
+    'N3': load('N3'),
+    '9 | d <= 1e18': [9 * random.randint(1, 10**18 // 9) for _ in range(2000)],
+}
+
+print(f'{"inputs":>14} {"recursive s":>12} {"table s":>8} {"speedup":>8} {"rec KiB":>8} {"table KiB":>10}')
+for name, numbers in inputs.items():
+    row = []
+    for engine in (find_pair_digit_dp, find_pair_table_dp):
+        start = time.perf_counter()
+        answers = [engine(d) for d in numbers]
+        elapsed = time.perf_counter() - start
+        # Peak memory in a second, traced run, so tracing does not skew the time
+        tracemalloc.start()
+        for d in numbers:
+            engine(d)
+        row.append((elapsed, tracemalloc.get_traced_memory()[1] / 1024, answers))
+        tracemalloc.stop()
+    (rec_time, rec_peak, expected), (table_time, table_peak, answers) = row
+    assert answers == expected, f'table DP disagrees on {name}'
+    print(f'{name:>14} {rec_time:>12.3f} {table_time:>8.3f} {rec_time / table_time:>7.1f}x '
+          f'{rec_peak:>8.0f} {table_peak:>10.0f}')
@@ -0,0 +1,25 @@
+def digit_sum(n):
+    return sum(map(int, str(n)))
+
+
+def build_pair(d):
+    """
+    A pair (x, x + d) with equal digit sums, built directly, or None.
+
+    Each carry in x + d takes 9 off the digit sum, so
+    digit_sum(x + d) = digit_sum(x) + digit_sum(d) - 9 * carries, and the
+    pair works exactly when the addition carries digit_sum(d) / 9 times.
+    That needs d % 9 == 0 (otherwise there is no pair at all, as the sums
+    differ mod 9). Put c = digit_sum(d) / 9 nines in x starting at the top
+    digit of d: the top digit (at least 1) plus 9 carries, and each nine
+    above it plus the incoming 1 carries again, c times in all. Every other
+    digit of x is 0, so nothing else carries. O(len(d)), no search.
+    """
+    if d == 0:
+        return 0, 0
+    if d % 9 != 0:
+        return None
+    digits = str(d)
+    carries = digit_sum(d) // 9
+    x = int('9' * carries + '0' * (len(digits) - 1))
+    return x, x + d
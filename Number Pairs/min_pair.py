@@ -0,0 +1,67 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from table_dp import STEPS
+
+
+def shifted(bits, shift):
+    return bits << shift if shift >= 0 else bits >> -shift
+
+
+def find_min_pair(d):
+    """
+    The pair (x, x + d) with equal digit sums and the smallest x, or None.
+
+    y = x + d grows with x, so the same pair also has the smallest x + y
+    and the fewest digits in both numbers. The minimal x has at most
+    L = len(d) + 1 digits (the digit DP always finds one that short), so
+    it is the lexicographically smallest digit string of length L, most
+    significant digit first.
+
+    Two passes of bitsets over (position, carry, delta), as in table_dp:
+    forward[pos][carry] holds the deltas reachable from the start with some
+    choice of the low digits. The top-down pass then keeps allowed[carry],
+    the states at the current position that can still complete the digits
+    already fixed above it. At each position it takes the smallest digit
+    that leads from a forward-reachable state into an allowed state, and
+    those states become the new allowed set. That is O(L * carries * 10)
+    bitset operations, each over the 18L + 1 deltas, and no search.
+    """
+    if d == 0:
+        return 0, 0
+
+    if d % 9 != 0:
+        return None
+    digits = list(map(int, str(d)[::-1])) + [0]
+    L = len(digits)
+    max_delta = 9 * L
+    full = (1 << (2 * max_delta + 1)) - 1
+
+    forward = [[0, 0] for _ in range(L + 1)]
+    forward[0][0] = 1 << max_delta
+    for pos in range(L):
+        current, following = forward[pos], forward[pos + 1]
+        for carry in range(2):
+            if not current[carry]:
+                continue
+            for carry_out, shift in STEPS[digits[pos]][carry]:
+                following[carry_out] |= shifted(current[carry], shift) & full
+
+    allowed = [1 << max_delta, 0]
+    if not forward[L][0] & allowed[0]:
+        return None
+    a_digits = []
+    for pos in range(L - 1, -1, -1):
+        steps = STEPS[digits[pos]]
+        for a_i in range(10):
+            states = [forward[pos][carry]
+                      & shifted(allowed[steps[carry][a_i][0]], -steps[carry][a_i][1])
+                      for carry in range(2)]
+            if states[0] or states[1]:
+                break
+        a_digits.append(a_i)
+        allowed = states
+    a = int(''.join(map(str, a_digits)))
+    b = a + d
+    return a, b
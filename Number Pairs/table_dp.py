@@ -0,0 +1,56 @@
+# For every digit of d and carry in, the (carry out, a_i - b_i) of each
+# digit a_i = 0..9 of a
+STEPS = [[[((a_i + d_i + carry) // 10, a_i - (a_i + d_i + carry) % 10) for a_i in range(10)]
+          for carry in range(2)]
+         for d_i in range(10)]
+
+
+def find_pair_table_dp(d):
+    """
+    The digit DP of find_pair_digit_dp, bottom-up and without recursion.
+
+    reach[pos][carry] is a bitset over the digit-sum difference: bit
+    delta + max_delta is set when digits pos .. L-1 can still finish with no
+    carry and a zero difference. It is filled from the top position down,
+    and each of the ten digits of a is one shift and one OR over every
+    delta at once. The table is (L + 1) x 2 ints of 18L + 1 bits, allocated
+    up front. Walking back up from the bottom digit, the chosen a_i is the
+    smallest one whose next state is set. That is the digit the depth-first
+    search would try first and succeed with, so the pairs are identical.
+    """
+    if d == 0:
+        return 0, 0
+
+    if d % 9 != 0:
+        return None
+    digits = list(map(int, str(d)[::-1])) + [0]
+    L = len(digits)
+    max_delta = 9 * L
+    width = 2 * max_delta + 1
+    full = (1 << width) - 1
+
+    reach = [[0, 0] for _ in range(L + 1)]
+    reach[L][0] = 1 << max_delta
+    for pos in range(L - 1, -1, -1):
+        following = reach[pos + 1]
+        for carry in range(2):
+            bits = 0
+            for carry_out, shift in STEPS[digits[pos]][carry]:
+                after = following[carry_out]
+                bits |= after >> shift if shift >= 0 else after << -shift
+            reach[pos][carry] = bits & full
+
+    if not reach[0][0] >> max_delta & 1:
+        return None
+    a_digits = []
+    carry, delta = 0, max_delta
+    for pos in range(L):
+        following = reach[pos + 1]
+        for a_i, (carry_out, shift) in enumerate(STEPS[digits[pos]][carry]):
+            if 0 <= delta + shift < width and following[carry_out] >> (delta + shift) & 1:
+                break
+        a_digits.append(a_i)
+        carry, delta = carry_out, delta + shift
+    a = int(''.join(map(str, reversed(a_digits))))
+    b = a + d
+    return a, b
@@ -0,0 +1,40 @@
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from constructive import build_pair, digit_sum
+
+# The N3 digit DP, without its file loop
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'N3', 'digit_dp.py')) as f:
+    source = f.read()
+exec(source[:source.index('with open(')])
+
+MAX_D = 10**18
+CASES = 20000
+
+
+def check(d, pair):
+    x, y = pair
+    assert 0 <= x and y - x == d and digit_sum(x) == digit_sum(y), (d, pair)
+    assert len(str(y)) <= 50, (d, pair)
+
+
+random.seed(2025)
+# Half arbitrary d, half multiples of 9, plus the edges of the range
+cases = [random.randint(1, MAX_D) for _ in range(CASES // 2)]
+cases += [9 * random.randint(1, MAX_D // 9) for _ in range(CASES // 2)]
+cases += [1, 9, 18, 99, 10**17, MAX_D - 1, MAX_D, 9 * (MAX_D // 9), int('9' * 18), int('18' * 9)]
+
+start = time.perf_counter()
+solved = 0
+for d in cases:
+    expected = find_pair_digit_dp(d)
+    got = build_pair(d)
+    assert (got is None) == (expected is None), d
+    if got is not None:
+        check(d, expected)
+        check(d, got)
+        solved += 1
+print(f'{len(cases)} d up to {MAX_D} agree with the DP ({solved} with a pair) in {time.perf_counter() - start:.2f}s')
@@ -0,0 +1,154 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from sparse_board import WHITE, BLACK
+
+
+def black_moves(board):
+    """Moves of every black rook in the starting position (0 for white rooks)."""
+    moves = np.zeros(board.n, dtype=np.int64)
+    for nb, edge in ((board.left, board.cols), (board.right, board.d - 1 - board.cols),
+                     (board.up, board.rows), (board.down, board.d - 1 - board.rows)):
+        j = np.maximum(nb, 0)
+        run = (np.abs(board.rows[j] - board.rows) + np.abs(board.cols[j] - board.cols) - 1
+               + (board.colour[j] == WHITE))
+        moves += np.where(nb == -1, edge, run)
+    moves[board.colour != BLACK] = 0
+    return moves
+
+
+def sliding_total(board, moves, base):
+    """
+    Sum, over every white move along its own row, of the black moves left
+    afterwards. Vertical moves are the same computation on the transposed board.
+
+    Every target is scored as `base` plus a closed-form correction for the few
+    black rooks whose neighbours change. The only correction that depends on
+    the target square is the one for the column it lands in; those are linear
+    in the row inside each gap between two rooks of a column, so they are
+    summed over a whole run of empty squares with a row sweep and two Fenwick
+    trees over the occupied columns.
+    """
+    d = board.d
+    rows, cols = board.rows.tolist(), board.cols.tolist()
+    black = (board.colour == BLACK).tolist()
+    left, right = board.left.tolist(), board.right.tolist()
+    up, down = board.up.tolist(), board.down.tolist()
+    moves = moves.tolist()
+    col_rank = np.searchsorted(board.col_keys, board.cols).tolist()
+    size = len(board.col_keys)
+    tree_a = [0] * (size + 1)
+    tree_b = [0] * (size + 1)
+
+    def gap(p_idx, q_idx):
+        # Correction for a white rook landing inside the column gap (P, Q)
+        p = rows[p_idx] if p_idx >= 0 else -1
+        q = rows[q_idx] if q_idx >= 0 else d
+        p_black = p_idx >= 0 and black[p_idx]
+        q_black = q_idx >= 0 and black[q_idx]
+        p_white = p_idx >= 0 and not black[p_idx]
+        q_white = q_idx >= 0 and not black[q_idx]
+        alpha = p_black - q_black
+        beta = p_black * (1 - q - q_white) + q_black * (p + 1 - p_white)
+        return alpha, beta
+
+    def add(pos, da, db):
+        pos += 1
+        while pos <= size:
+            tree_a[pos] += da
+            tree_b[pos] += db
+            pos += pos & -pos
+
+    def prefix(pos):
+        sa = sb = 0
+        while pos > 0:
+            sa += tree_a[pos]
+            sb += tree_b[pos]
+            pos -= pos & -pos
+        return sa, sb
+
+    # Every column starts in the gap above its first rook
+    current = [(0, 0)] * size
+    for k, first in enumerate(board.col_order[board.col_offsets[:-1]].tolist()):
+        current[k] = gap(-1, first)
+        add(k, *current[k])
+
+    total = 0
+    row_order = board.row_order.tolist()
+    offsets = board.row_offsets.tolist()
+    for k in range(len(offsets) - 1):
+        line = row_order[offsets[k]:offsets[k+1]]
+        r = rows[line[0]]
+
+        for i in line:
+            if black[i]:
+                continue
+            c = cols[i]
+            A, B, U, D = left[i], right[i], up[i], down[i]
+            a = cols[A] if A >= 0 else -1
+            b = cols[B] if B >= 0 else d
+            u = rows[U] if U >= 0 else -1
+            v = rows[D] if D >= 0 else d
+            a_black = A >= 0 and black[A]
+            b_black = B >= 0 and black[B]
+
+            # Lifting the rook off (r, c) opens up its column
+            lifted = 0
+            if U >= 0 and black[U]:
+                lifted += v - r - 1 + (D >= 0 and not black[D])
+            if D >= 0 and black[D]:
+                lifted += r - u - 1 + (U >= 0 and not black[U])
+
+            # Quiet moves to the empty squares a+1 .. b-1 (except c)
+            quiet = b - a - 2
+            total += quiet * (base + lifted)
+            if a_black != b_black:
+                span = b - a - 1
+                shift = span * (a + b) // 2 - span * c
+                total += (a_black - b_black) * shift
+            lo = col_rank[A] + 1 if A >= 0 else 0
+            hi = col_rank[B] if B >= 0 else size
+            sa1, sb1 = prefix(lo)
+            sa2, sb2 = prefix(col_rank[i])
+            sa3, sb3 = prefix(col_rank[i] + 1)
+            sa4, sb4 = prefix(hi)
+            total += (sa2 - sa1 + sa4 - sa3) * r + (sb2 - sb1 + sb4 - sb3)
+
+            # Captures of the neighbouring black rooks
+            if a_black:
+                total += base - moves[A] + lifted + b_black * (c - a)
+                total += left[A] >= 0 and black[left[A]]
+                total += (up[A] >= 0 and black[up[A]]) + (down[A] >= 0 and black[down[A]])
+            if b_black:
+                total += base - moves[B] + lifted + a_black * (b - c)
+                total += right[B] >= 0 and black[right[B]]
+                total += (up[B] >= 0 and black[up[B]]) + (down[B] >= 0 and black[down[B]])
+
+        # Rooks on this row split their column gap in two
+        for i in line:
+            k = col_rank[i]
+            old_a, old_b = current[k]
+            current[k] = gap(i, down[i])
+            add(k, current[k][0] - old_a, current[k][1] - old_b)
+
+    return total
+
+
+def count_rook_moves(board):
+    """
+    Count the ways to make one white move followed by one black move in
+    O(n log n), without enumerating the target squares.
+
+    The black move total of the starting position is computed once; every
+    white move is then scored as that total plus a correction for the black
+    rooks whose row or column neighbours change.
+    """
+    MOD = 10**9 + 7
+    moves = black_moves(board)
+    base = int(moves.sum())
+    total = sliding_total(board, moves, base)
+    total += sliding_total(board.transposed(), moves, base)
+    return total % MOD
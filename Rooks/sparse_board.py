@@ -0,0 +1,79 @@
+import numpy as np
+
+WHITE, BLACK = 0, 1
+
+
+class SparseBoard:
+    """
+    Coordinate-compressed storage for the rooks of one test case.
+
+    Nothing is allocated per row or column of the d x d board: the rooks are
+    kept in int64 arrays sorted by (row, col) and by (col, row), with CSR-style
+    offsets for every occupied line and a uint8 colour column. Memory scales
+    with n, and the nearest rook in each direction is looked up once, up front.
+    """
+    def __init__(self, d, rows, cols, colour):
+        self.d = d
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.cols = np.asarray(cols, dtype=np.int64)
+        self.colour = np.asarray(colour, dtype=np.uint8)
+        self.n = len(self.rows)
+
+        # Row-major: occupied rows, offsets into row_order, columns per row
+        self.row_order = np.lexsort((self.cols, self.rows))
+        self.row_keys, self.row_offsets = self._offsets(self.rows[self.row_order])
+        self.row_members = self.cols[self.row_order]
+
+        # Column-major: same layout with rows and columns swapped
+        self.col_order = np.lexsort((self.rows, self.cols))
+        self.col_keys, self.col_offsets = self._offsets(self.cols[self.col_order])
+        self.col_members = self.rows[self.col_order]
+
+        # Index of the nearest rook in each direction, -1 for the board edge
+        self.left, self.right = self._neighbours(self.rows, self.row_order)
+        self.up, self.down = self._neighbours(self.cols, self.col_order)
+
+    @classmethod
+    def from_rooks(cls, d, rooks):
+        """Build from a list of (r, c, 'W'|'B') tuples."""
+        rows = np.fromiter((r for r, c, t in rooks), dtype=np.int64, count=len(rooks))
+        cols = np.fromiter((c for r, c, t in rooks), dtype=np.int64, count=len(rooks))
+        colour = np.fromiter((t == 'B' for r, c, t in rooks), dtype=np.uint8, count=len(rooks))
+        return cls(d, rows, cols, colour)
+
+    @classmethod
+    def from_lines(cls, d, lines):
+        """Build from the 'r c t' input lines without creating per-rook tuples."""
+        fields = np.array(' '.join(lines).split())
+        rows = fields[0::3].astype(np.int64)
+        cols = fields[1::3].astype(np.int64)
+        colour = (fields[2::3] == 'B').astype(np.uint8)
+        return cls(d, rows, cols, colour)
+
+    @staticmethod
+    def _offsets(sorted_keys):
+        keys, starts = np.unique(sorted_keys, return_index=True)
+        offsets = np.append(starts, len(sorted_keys)).astype(np.int64)
+        return keys, offsets
+
+    @staticmethod
+    def _neighbours(keys, order):
+        prev = np.full(len(keys), -1, dtype=np.int64)
+        nxt = np.full(len(keys), -1, dtype=np.int64)
+        same = keys[order[1:]] == keys[order[:-1]]
+        prev[order[1:][same]] = order[:-1][same]
+        nxt[order[:-1][same]] = order[1:][same]
+        return prev, nxt
+
+    def transposed(self):
+        """The same board with rows and columns swapped, sharing all arrays."""
+        board = object.__new__(SparseBoard)
+        board.__dict__.update(self.__dict__)
+        board.rows, board.cols = self.cols, self.rows
+        board.row_order, board.col_order = self.col_order, self.row_order
+        board.row_keys, board.col_keys = self.col_keys, self.row_keys
+        board.row_offsets, board.col_offsets = self.col_offsets, self.row_offsets
+        board.row_members, board.col_members = self.col_members, self.row_members
+        board.left, board.up = self.up, self.left
+        board.right, board.down = self.down, self.right
+        return board
@@ -0,0 +1,18 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bitboard import BitPuzzle
+
+start_time = time.time()
+
+with open('Tiling Cheaply/T2/T2.in', 'r') as infile, \
+     open('Tiling Cheaply/T2/T2_BITBOARD.txt', 'w') as outfile:
+    next(infile)
+    for line in infile:
+        number = int(line.strip())
+        BitPuzzle(number).write_solution(outfile)
+
+end_time = time.time()
+print(f'Time taken {end_time - start_time}')
@@ -0,0 +1,18 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blocks import BlockPuzzle
+
+start_time = time.time()
+
+with open('Tiling Cheaply/T3/T3.in', 'r') as infile, \
+     open('Tiling Cheaply/T3/T3_BLOCKS.txt', 'w') as outfile:
+    next(infile)
+    for line in infile:
+        number = int(line.strip())
+        BlockPuzzle(number).write_solution(outfile)
+
+end_time = time.time()
+print(f'Time taken {end_time - start_time}')
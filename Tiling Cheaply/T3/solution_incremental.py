@@ -0,0 +1,20 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from incremental import IncrementalSolver
+
+start_time = time.time()
+
+solver = IncrementalSolver()
+with open('Tiling Cheaply/T3/T3.in', 'r') as infile, \
+     open('Tiling Cheaply/T3/T3_INCREMENTAL.txt', 'w') as outfile:
+    next(infile)
+    for line in infile:
+        number = int(line.strip())
+        solver.write_solution(outfile, number)
+        print(f'n={number} cost={solver.costs[number]} from={solver.derived_from[number]}')
+
+end_time = time.time()
+print(f'Time taken {end_time - start_time}')
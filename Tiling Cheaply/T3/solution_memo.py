@@ -1,4 +1,12 @@
-from collections import deque, defaultdict
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from coloring import TilingOutput
+from symmetry import BoardSymmetry
+from transposition import TranspositionTable
+
+
 class Piece:
     # Working in y, x not x, y 
     figures = [[(0,0), (1,0), (1,1)], # L
@@ -25,18 +33,35 @@ class Piece:
         return [(-x, y) for (y, x) in figure]
     
 
-class Puzzle:
-    def __init__(self, n):
+class Puzzle(TilingOutput):
+    """
+    With symmetry=True the 8 rotations/reflections of the board are used twice
+    (see BoardSymmetry). The memo key is the smallest of the 8 images of the
+    occupancy, together with the piece at (0,0), so mirrored partial boards
+    share an entry (the piece set is closed under the group: S and Z mirror
+    each other, L maps to L). And a piece covering a corner is only placed
+    if, moved onto (0,0) by a symmetry, it does not sort before the piece at
+    (0,0).
+    """
+    def __init__(self, n, memo_size=1000000, eviction='lru', symmetry=True):
         self.n = n
         self.board = [[0 for _ in range(n)] for _ in range(n)]
+        self.occupancy = 0
+        self.filled = 0
         self.best_cost = 9999
         self.best_layout = None
+        self.best_placements = None
+        self.placements = []
         self.figures = [Piece(i) for i in range(4)][::-1]
-        self.memo = {}
+        self.memo = TranspositionTable(memo_size, eviction)
+        self.symmetry = symmetry
+        self.group = BoardSymmetry(n)
 
     def board_signature(self):
-        return hash(str(self.board))
-    
+        if self.symmetry:
+            return self.group.key()
+        return self.occupancy
+
     def can_place(self, fig_pos, pos):
         y, x = pos
         for (f_y, f_x) in fig_pos:
@@ -52,6 +77,15 @@ class Puzzle:
         y, x = pos
         for (f_y, f_x) in fig_pos:
             self.board[y+f_y][x+f_x] = fig_id
+            cell = (y+f_y) * self.n + x+f_x
+            bit = 1 << cell
+            if fig_id:
+                self.occupancy |= bit
+            else:
+                self.occupancy &= ~bit
+            if self.symmetry:
+                self.group.toggle(cell)
+        self.filled += len(fig_pos) if fig_id else -len(fig_pos)
 
     def is_solved(self):
         return all(all(cell != 0 for cell in row) for row in self.board)
@@ -78,11 +112,12 @@ class Puzzle:
         prev_cost = self.memo.get(sig)
         if prev_cost is not None and current_cost >= prev_cost:
             return False
-        self.memo[sig] = current_cost
+        self.memo.store(sig, current_cost, self.filled)
 
         empty = self.next_empty()
         if not empty:
             self.best_layout = [row[:] for row in self.board]
+            self.best_placements = list(self.placements)
             self.best_cost = current_cost
             return True
         y0, x0 = empty
@@ -90,78 +125,30 @@ class Puzzle:
             for pos in figure.possible_pos:
                 if not self.can_place(pos, (y0, x0)):
                     continue
+                cells = sorted((y0 + f_y, x0 + f_x) for f_y, f_x in pos)
+                if self.symmetry and self.group.breaks_symmetry(figure.cost, cells):
+                    continue
+                root = self.symmetry and self.group.corner_key is None and cells[0] == (0, 0)
+                if root:
+                    self.group.corner_key = (figure.cost, tuple(cells))
                 self.place(pos, fig_id, (y0, x0))
+                self.placements.append(cells)
                 stop = self.backtrack(fig_id + 1, current_cost + figure.cost)
                 if stop:
                     return True
+                self.placements.pop()
                 self.place(pos, 0, (y0, x0))
+                if root:
+                    self.group.corner_key = None
         return False
     
     def print_board(self):
         for row in self.best_layout:
             print(f'{row}' + '\n')
      
-    def color_regions(self, mat):
-        R, C = len(mat), len(mat[0])
-        region_id = [[None]*C for _ in range(R)]
-        regions = {}  
-        next_id = 0
-
-        for i in range(R):
-            for j in range(C):
-                if region_id[i][j] is None:
-                    val = mat[i][j]
-                    # BFS flood-fill
-                    q = deque([(i,j)])
-                    region_id[i][j] = next_id
-                    cells = [(i,j)]
-                    while q:
-                        x,y = q.popleft()
-                        for dx,dy in [(1,0),(-1,0),(0,1),(0,-1)]:
-                            nx,ny = x+dx, y+dy
-                            if 0 <= nx < R and 0 <= ny < C:
-                                if region_id[nx][ny] is None and mat[nx][ny] == val:
-                                    region_id[nx][ny] = next_id
-                                    cells.append((nx,ny))
-                                    q.append((nx,ny))
-                    regions[next_id] = {'value': val, 'cells': cells}
-                    next_id += 1
-
-        # 2) Build adjacency graph between regions
-        adj = defaultdict(set)
-        for rid, info in regions.items():
-            for (x,y) in info['cells']:
-                for dx,dy in [(1,0),(-1,0),(0,1),(0,-1)]:
-                    nx,ny = x+dx, y+dy
-                    if 0 <= nx < R and 0 <= ny < C:
-                        nbr_rid = region_id[nx][ny]
-                        if nbr_rid != rid:
-                            adj[rid].add(nbr_rid)
-                            adj[nbr_rid].add(rid)
-
-        colors = ['l','s', 'g', 'v', 'x', 'f', 'j', 'k', 'i', 't', 'r']
-        region_color = {}
-        order = sorted(regions.keys(), key=lambda r: len(adj[r]), reverse=True)
-        for rid in order:
-            used = { region_color[nbr] for nbr in adj[rid] if nbr in region_color }
-            for col in colors:
-                if col not in used:
-                    region_color[rid] = col
-                    break
-            else:
-                raise ValueError(f"Ran out of colors for region {rid}!")  
-        color_mat = [[region_color[region_id[i][j]] for j in range(C)] for i in range(R)]
-        s = '\n'.join(''.join(row) for row in color_mat)
-        return s
-
-    def get_solution(self):
-        
-        matrix, cost = self.solve()
-        if matrix:
-            string = 'YES' + '\n' + self.color_regions(matrix) + '\n'
-        else:
-            string = 'NO' + '\n'
-        return string
+    def pieces(self):
+        """Cells of every piece of the best layout, in placement order."""
+        return self.best_placements
 
 
 with open('Tiling Cheaply/T3/T3.in', 'r') as infile, \
@@ -169,5 +156,6 @@ with open('Tiling Cheaply/T3/T3.in', 'r') as infile, \
     next(infile)
     for line in infile:
         number = int(line.strip())
-        string = Puzzle(number).get_solution()
-        outfile.write(f'{string}')
\ No newline at end of file
+        puzzle = Puzzle(number)
+        puzzle.write_solution(outfile)
+        print(f'n={number} {puzzle.memo.stats()}')
\ No newline at end of file
@@ -0,0 +1,27 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitboard import BitPuzzle
+from blocks import BlockPuzzle
+from dancing_links import DLXPuzzle
+from parallel import ParallelPuzzle
+from profile_dp import ProfilePuzzle
+from rectangles import RectanglePuzzle
+
+# Every backend takes n and exposes solve() -> (layout, cost), get_solution()
+# and write_solution(outfile)
+BACKENDS = {
+    'raster': BitPuzzle,
+    'dlx': DLXPuzzle,
+    'dp': ProfilePuzzle,
+    'parallel': ParallelPuzzle,
+    'blocks': BlockPuzzle,
+    'table': RectanglePuzzle,
+}
+
+
+def make_puzzle(n, backend='raster'):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {sorted(BACKENDS)}")
+    return BACKENDS[backend](n)
@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitboard import BitPuzzle
+from dancing_links import DLXPuzzle
+
+NODE_BUDGET = 200000
+# Both searches recurse once per piece, up to n*n/3 deep on T3
+sys.setrecursionlimit(20000)
+
+
+class OutOfBudget(Exception):
+    pass
+
+
+class BudgetedRaster(BitPuzzle):
+    def __init__(self, n):
+        super().__init__(n, use_bound=True)
+
+    def solve(self):
+        return self.solve_optimal()
+
+    def backtrack(self, fig_id, current_cost):
+        if self.nodes > NODE_BUDGET:
+            raise OutOfBudget
+        return super().backtrack(fig_id, current_cost)
+
+
+class BudgetedDLX(DLXPuzzle):
+    def search(self, current_cost):
+        if self.nodes > NODE_BUDGET:
+            raise OutOfBudget
+        return super().search(current_cost)
+
+
+def run(engine, n):
+    start = time.perf_counter()
+    puzzle = engine(n)
+    try:
+        layout, cost = puzzle.solve()
+        result = cost if layout else 'NO'
+    except OutOfBudget:
+        result = 'budget'
+    return result, puzzle.nodes, time.perf_counter() - start
+
+
+engines = {'raster': BudgetedRaster, 'dlx': BudgetedDLX}
+
+print(f'{"input":>5} {"n":>4} {"engine":>7} {"result":>7} {"nodes":>7} {"seconds":>8}')
+for task in ('T1', 'T2', 'T3'):
+    with open(f'Tiling Cheaply/{task}/{task}.in', 'r') as infile:
+        next(infile)
+        sizes = [int(line) for line in infile if line.strip()]
+    for n in sizes:
+        for name, engine in engines.items():
+            result, nodes, elapsed = run(engine, n)
+            print(f'{task:>5} {n:>4} {name:>7} {result:>7} {nodes:>7} {elapsed:>8.3f}')
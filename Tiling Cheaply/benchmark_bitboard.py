@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitboard import BitPuzzle
+
+NODE_BUDGET = 500000
+
+
+class OutOfBudget(Exception):
+    pass
+
+
+def load_list_puzzle(path):
+    # Only the class definitions: the script solves its input file on import
+    with open(path, 'r') as f:
+        source = f.read()
+    namespace = {}
+    exec(source[:source.index('with open(')], namespace)
+    return namespace['Puzzle']
+
+
+def counted(engine):
+    # Both engines are counted the same way, one call of backtrack per node
+    class Counted(engine):
+        calls = 0
+
+        def backtrack(self, fig_id, current_cost):
+            self.calls += 1
+            if self.calls > NODE_BUDGET:
+                raise OutOfBudget
+            return super().backtrack(fig_id, current_cost)
+    return Counted
+
+
+def run(engine, n):
+    puzzle = engine(n)
+    start = time.perf_counter()
+    try:
+        layout, cost = puzzle.solve()
+        result = cost if layout else 'NO'
+    except OutOfBudget:
+        result = 'budget'
+    elapsed = time.perf_counter() - start
+    return result, puzzle.calls, elapsed
+
+
+engines = {
+    'list': counted(load_list_puzzle('Tiling Cheaply/T2/solution.py')),
+    'bitboard': counted(BitPuzzle),
+}
+
+print(f'{"n":>3} {"engine":>9} {"result":>7} {"nodes":>8} {"seconds":>8} {"nodes/s":>9}')
+for n in range(1, 11):
+    for name, engine in engines.items():
+        result, nodes, elapsed = run(engine, n)
+        rate = nodes / elapsed if elapsed else 0
+        print(f'{n:>3} {name:>9} {result:>7} {nodes:>8} {elapsed:>8.3f} {rate:>9.0f}')
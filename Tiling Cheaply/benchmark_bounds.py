@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitboard import BitPuzzle
+from bounds import lower_bound
+
+NODE_BUDGET = 5000000
+
+
+class OutOfBudget(Exception):
+    pass
+
+
+class Budgeted(BitPuzzle):
+    def backtrack(self, fig_id, current_cost):
+        if self.nodes > NODE_BUDGET:
+            raise OutOfBudget
+        return super().backtrack(fig_id, current_cost)
+
+
+def run(n, method, use_bound):
+    puzzle = Budgeted(n, use_bound)
+    start = time.perf_counter()
+    try:
+        layout, cost = getattr(puzzle, method)()
+        result = cost if layout else 'NO'
+    except OutOfBudget:
+        result = 'budget'
+    return result, puzzle.nodes, time.perf_counter() - start
+
+
+# Optimal search without the bound has to exhaust the tree to prove its
+# answer, with it the search stops at the first layout meeting the bound
+modes = [('plain', 'solve_optimal', False),
+         ('bound', 'solve_optimal', True),
+         ('deepening', 'solve_deepening', True)]
+
+print(f'{"n":>3} {"bound":>5} {"mode":>9} {"result":>7} {"nodes":>8} {"seconds":>8} {"saved":>8}')
+for n in range(1, 11):
+    baseline = None
+    for name, method, use_bound in modes:
+        result, nodes, elapsed = run(n, method, use_bound)
+        if baseline is None:
+            baseline = nodes
+            saved = ''
+        else:
+            saved = f'{baseline - nodes}' if baseline <= NODE_BUDGET else f'>{NODE_BUDGET - nodes}'
+        print(f'{n:>3} {lower_bound(n, n):>5} {name:>9} {result:>7} {nodes:>8} {elapsed:>8.3f} {saved:>8}')
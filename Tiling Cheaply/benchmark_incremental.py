@@ -0,0 +1,46 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from incremental import IncrementalSolver
+from profile_dp import ProfilePuzzle
+from rectangles import RectanglePuzzle
+
+REPEATS = 3
+
+
+def incremental(sizes):
+    solver = IncrementalSolver()
+    solver.table = RectanglePuzzle.table
+    for n in sizes:
+        solver.solve(n)
+
+
+def table(sizes):
+    for n in sizes:
+        RectanglePuzzle(n).solve()
+
+
+def profile(sizes):
+    for n in sizes:
+        ProfilePuzzle(n).solve()
+
+
+if __name__ == '__main__':
+    with open('Tiling Cheaply/T3/T3.in', 'r') as infile:
+        next(infile)
+        sizes = [int(line) for line in infile if line.strip()]
+
+    # Load and validate the table and the block library once, outside the timings
+    RectanglePuzzle.table.lookup(2, 2)
+
+    print(f'{"mode":>12} {"seconds":>8}')
+    for name, run in (('incremental', incremental), ('table', table), ('profile', profile)):
+        best = None
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            run(sizes)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f'{name:>12} {best:>8.3f}')
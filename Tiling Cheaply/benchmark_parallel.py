@@ -0,0 +1,32 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from parallel import ParallelPuzzle
+
+WORKERS = [1, 2, 4]
+
+
+if __name__ == '__main__':
+    with open('Tiling Cheaply/T2/T2.in', 'r') as infile:
+        next(infile)
+        sizes = [int(line) for line in infile if line.strip()]
+
+    print(f'cpus: {os.cpu_count()}')
+    print(f'{"workers":>7} {"nodes":>9} {"seconds":>8} {"speedup":>8} {"same":>5}')
+    baseline = None
+    for workers in WORKERS:
+        start = time.perf_counter()
+        nodes = 0
+        answers = []
+        for n in sizes:
+            puzzle = ParallelPuzzle(n, workers)
+            answers.append(puzzle.get_solution())
+            nodes += puzzle.nodes
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = (elapsed, answers)
+        speedup = baseline[0] / elapsed
+        same = answers == baseline[1]
+        print(f'{workers:>7} {nodes:>9} {elapsed:>8.2f} {speedup:>8.2f} {same!s:>5}')
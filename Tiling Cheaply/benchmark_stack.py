@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitboard import BitPuzzle
+from stack_search import StackPuzzle
+
+NODE_BUDGET = 200000
+SLICE = 50000
+
+
+def timed(puzzle, method):
+    start = time.process_time()
+    layout, cost = getattr(puzzle, method)()
+    return cost if layout else 'NO', puzzle.nodes, time.process_time() - start
+
+
+print(f'{"n":>3} {"mode":>13} {"engine":>11} {"result":>6} {"nodes":>8} {"nodes/s":>8}')
+for n in (5, 7):
+    for method, use_bound in (('solve', False), ('solve_optimal', True)):
+        for engine in (BitPuzzle, StackPuzzle):
+            result, nodes, elapsed = timed(engine(n, use_bound), method)
+            rate = nodes / elapsed if elapsed else 0
+            print(f'{n:>3} {method:>13} {engine.__name__:>11} {result:>6} {nodes:>8} {rate:>8.0f}')
+
+# T3 sizes in slices of SLICE nodes, up to NODE_BUDGET, without touching the recursion limit
+print()
+print(f'{"n":>3} {"result":>6} {"nodes":>8} {"slices":>6} {"depth":>6}')
+with open('Tiling Cheaply/T3/T3.in', 'r') as infile:
+    next(infile)
+    for line in infile:
+        n = int(line)
+        puzzle = StackPuzzle(n, use_bound=True)
+        slices = 0
+        while puzzle.nodes < NODE_BUDGET and not puzzle.run(SLICE):
+            slices += 1
+        if puzzle.done:
+            result = puzzle.best_cost if puzzle.best_layout else 'NO'
+        else:
+            result = 'paused'
+        print(f'{n:>3} {result:>6} {puzzle.nodes:>8} {slices:>6} {len(puzzle.stack):>6}')
@@ -0,0 +1,171 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bounds import corner_mask, lower_bound
+from coloring import TilingOutput
+
+
+class BitPiece:
+    # Same figures as Piece, working in y, x not x, y
+    figures = [[(0,0), (1,0), (1,1)], # L
+               [(0,1), (0,2), (1,0), (1,1)], # S
+               [(0,0), (0,1), (1,1), (1,2)], # Z
+               [(0,0), (0,1), (1,0), (1,1)]] # O
+
+    # Figure Id 0 -> L, 1 -> S, 2 -> Z, 3 -> O
+    def __init__(self, fig_id, width):
+        self.fig_id = fig_id
+        self.cost = 1 if fig_id == 0 else 0
+        self.size = len(self.figures[fig_id])
+        self.possible_pos = []
+        figure = self.figures[fig_id]
+        for _ in range(4):
+            figure = self.normalize(figure)
+            if figure not in self.possible_pos:
+                self.possible_pos.append(figure)
+            figure = self.rotate_90(figure)
+
+        # Each distinct rotation as a mask whose first cell (in raster order)
+        # is bit 0, so it can be shifted straight onto the first empty cell
+        self.masks = []
+        for figure in self.possible_pos:
+            y0, x0 = figure[0]
+            mask = 0
+            for y, x in figure:
+                mask |= 1 << ((y - y0) * width + (x - x0))
+            self.masks.append(mask)
+
+    def normalize(self, figure):
+        min_y = min(y for y, x in figure)
+        min_x = min(x for y, x in figure)
+        return sorted((y - min_y, x - min_x) for y, x in figure)
+
+    def rotate_90(self, figure):
+        return [(-x, y) for (y, x) in figure]
+
+
+class BitPuzzle(TilingOutput):
+    """
+    Same search as Puzzle, with the whole board held in a single int.
+
+    Rows are n+1 bits wide: the extra column and two extra rows at the bottom
+    are pre-filled, so a shifted mask that sticks out of the board always
+    collides with them and a placement needs a single `&` and no bounds check.
+    The first empty cell is the lowest zero bit, `(board + 1) & ~board`.
+
+    With use_bound every node is cut when its cost plus the colouring bound of
+    the empty cells cannot beat best_cost (see bounds.py).
+    """
+    def __init__(self, n, use_bound=False):
+        self.n = n
+        self.width = n + 1
+        self.limit = n * self.width
+        column = 0
+        for y in range(n):
+            column |= 1 << (y * self.width + n)
+        self.board = column | (((1 << (2 * self.width)) - 1) << self.limit)
+        self.best_cost = 9999
+        self.best_layout = None
+        self.best_placements = None
+        self.figures = [BitPiece(i, self.width) for i in range(4)][::-1]
+        self.placements = []
+        self.nodes = 0
+        self.use_bound = use_bound
+        self.bound = lower_bound(n, n)
+        self.corners = corner_mask(n, self.width)
+        self.empty_cells = n * n
+        self.empty_corners = ((n + 1) // 2) ** 2
+        # A layout this cheap is optimal, so the search can stop there
+        self.target = 9999
+
+    def next_empty(self):
+        board = self.board
+        return ((board + 1) & ~board).bit_length() - 1
+
+    def layout(self):
+        board = [[0] * self.n for _ in range(self.n)]
+        for fig_id, (pos, mask) in enumerate(self.placements, start=1):
+            while mask:
+                low = mask & -mask
+                y, x = divmod(pos + low.bit_length() - 1, self.width)
+                board[y][x] = fig_id
+                mask ^= low
+        return board
+
+    def solve(self):
+        self.backtrack(fig_id = 1, current_cost = 0)
+        return self.best_layout, self.best_cost
+
+    def solve_optimal(self):
+        """
+        Branch and bound for the cheapest layout: keep searching after the
+        first layout and stop once one meets the proven lower bound. Without
+        use_bound the tree is exhausted to prove the best layout optimal.
+        """
+        self.target = self.bound if self.use_bound else -1
+        self.backtrack(fig_id = 1, current_cost = 0)
+        return self.best_layout, self.best_cost
+
+    def solve_deepening(self):
+        """
+        Search for any layout of cost <= k for k = bound, bound+4, ... The
+        bound fixes the cost modulo 4, so the k in between add nothing. The
+        first k that succeeds is optimal and no branch above it is expanded.
+        """
+        self.use_bound = True
+        for k in range(self.bound, self.n * self.n // 3 + 1, 4):
+            self.best_cost = k + 1
+            if self.backtrack(fig_id = 1, current_cost = 0):
+                return self.best_layout, self.best_cost
+        self.best_cost = 9999
+        return None, self.best_cost
+
+    def backtrack(self, fig_id, current_cost):
+        if self.use_bound:
+            # bounds.remaining_bound, inlined: this runs at every node
+            cells, corners = self.empty_cells, self.empty_corners
+            needed = max(0, 4 * corners - cells)
+            needed += (3 * cells - needed) % 4
+            if current_cost + needed >= self.best_cost:
+                return False
+        elif current_cost >= self.best_cost:
+            return False
+        self.nodes += 1
+        board = self.board
+        pos = ((board + 1) & ~board).bit_length() - 1
+        if pos >= self.limit:
+            self.best_layout = self.layout()
+            self.best_placements = list(self.placements)
+            self.best_cost = current_cost
+            return current_cost <= self.target
+        for figure in self.figures:
+            for mask in figure.masks:
+                placed = mask << pos
+                if board & placed:
+                    continue
+                corners = (placed & self.corners).bit_count()
+                self.board = board | placed
+                self.empty_cells -= figure.size
+                self.empty_corners -= corners
+                self.placements.append((pos, mask))
+                stop = self.backtrack(fig_id + 1, current_cost + figure.cost)
+                if stop:
+                    return True
+                self.placements.pop()
+                self.board = board
+                self.empty_cells += figure.size
+                self.empty_corners += corners
+        return False
+
+    def pieces(self):
+        """Cells of every piece of the best layout, in placement order."""
+        pieces = []
+        for pos, mask in self.best_placements:
+            cells = []
+            while mask:
+                low = mask & -mask
+                cells.append(divmod(pos + low.bit_length() - 1, self.width))
+                mask ^= low
+            pieces.append(cells)
+        return pieces
@@ -0,0 +1,140 @@
+import os
+import sys
+import json
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitboard import BitPiece
+from bounds import lower_bound
+from coloring import TilingOutput
+from profile_dp import ProfileDP
+
+LIBRARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'blocks.json')
+
+# Every side from 2 to 9: the 7x7 core, its strips and the 2x2 filler, plus
+# 5x9, the smallest 5-high block with an odd width (rectangles.py needs it)
+BLOCK_SIDES = range(2, 10)
+
+
+class BlockLibrary:
+    """
+    Optimal tilings of small rectangles, stored in blocks.json.
+
+    The file is only read the first time a block is asked for. Every block is
+    checked on load: the pieces must be rotations of the four figures, cover
+    the rectangle exactly once and use exactly lower_bound(h, w) L triminoes,
+    so a block is optimal by the colouring argument and not by trust.
+    """
+    def __init__(self, path=LIBRARY_PATH):
+        self.path = path
+        self.blocks = None
+
+    def load(self):
+        with open(self.path, 'r') as f:
+            raw = json.load(f)
+        shapes = [BitPiece(fig_id, 1).possible_pos for fig_id in range(4)]
+        blocks = {}
+        for key, block in raw.items():
+            h, w = map(int, key.split('x'))
+            pieces = [(fig_id, [tuple(cell) for cell in cells]) for fig_id, cells in block['pieces']]
+            seen = set()
+            for fig_id, cells in pieces:
+                min_y = min(y for y, x in cells)
+                min_x = min(x for y, x in cells)
+                if sorted((y - min_y, x - min_x) for y, x in cells) not in shapes[fig_id]:
+                    raise ValueError(f"Block {key}: piece {cells} is not a rotation of figure {fig_id}!")
+                seen.update(cells)
+            cells = sum(len(cells) for fig_id, cells in pieces)
+            if cells != h * w or seen != {(y, x) for y in range(h) for x in range(w)}:
+                raise ValueError(f"Block {key} does not cover its {h}x{w} rectangle exactly once!")
+            cost = sum(1 for fig_id, cells in pieces if fig_id == 0)
+            if cost != block['cost'] or cost != lower_bound(h, w):
+                raise ValueError(f"Block {key} costs {cost}, expected {lower_bound(h, w)}!")
+            blocks[(h, w)] = (cost, pieces)
+        self.blocks = blocks
+
+    def get(self, h, w):
+        if self.blocks is None:
+            self.load()
+        return self.blocks[(h, w)]
+
+    def has(self, h, w):
+        if self.blocks is None:
+            self.load()
+        return (h, w) in self.blocks
+
+    @staticmethod
+    def build(path=LIBRARY_PATH):
+        """Solve every h x w block with ProfileDP and write the library. Run offline."""
+        library = {}
+        for h in BLOCK_SIDES:
+            for w in BLOCK_SIDES:
+                dp = ProfileDP(h, w)
+                cost, placements = dp.solve()
+                if cost is None:
+                    continue
+                assert dp.exact and cost == lower_bound(h, w)
+                library[f'{h}x{w}'] = {'cost': cost,
+                                       'pieces': [[fig_id, [list(cell) for cell in cells]]
+                                                  for fig_id, cells in placements]}
+        with open(path, 'w') as f:
+            json.dump(library, f, separators=(',', ':'))
+        return library
+
+
+class BlockPuzzle(TilingOutput):
+    """
+    Cheapest n x n tiling assembled from library blocks in O(n^2).
+
+    Even n is all 2x2 blocks. Odd n >= 7 is a 7x7 core (15) with 7x2 blocks
+    to its right and 2-row strips below, each a 2x3 block followed by 2x2
+    blocks (2 each): 15 + 4 * (n - 7) / 2 = 2n + 1 = lower_bound(n, n).
+    Any other n has a bound above n*n/3 and no tiling at all.
+    """
+    library = BlockLibrary()
+
+    def __init__(self, n):
+        self.n = n
+        self.best_cost = 9999
+        self.best_layout = None
+        self.placements = []
+
+    def blocks(self):
+        n = self.n
+        if n % 2 == 0:
+            return [(y, x, 2, 2) for y in range(0, n, 2) for x in range(0, n, 2)]
+        if n < 7:
+            return None
+        blocks = [(0, 0, 7, 7)]
+        blocks += [(0, x, 7, 2) for x in range(7, n, 2)]
+        for y in range(7, n, 2):
+            blocks.append((y, 0, 2, 3))
+            blocks += [(y, x, 2, 2) for x in range(3, n, 2)]
+        return blocks
+
+    def solve(self):
+        blocks = self.blocks()
+        if blocks is None:
+            return None, self.best_cost
+        self.placements = []
+        layout = [[0] * self.n for _ in range(self.n)]
+        cost = 0
+        for top, left, h, w in blocks:
+            block_cost, pieces = self.library.get(h, w)
+            cost += block_cost
+            for fig_id, cells in pieces:
+                self.placements.append((fig_id, [(top + y, left + x) for y, x in cells]))
+                for y, x in self.placements[-1][1]:
+                    layout[y][x] = len(self.placements)
+        # The colouring bound proves the assembled layout optimal
+        assert cost == lower_bound(self.n, self.n)
+        self.best_layout, self.best_cost = layout, cost
+        return self.best_layout, self.best_cost
+
+    def pieces(self):
+        """Cells of every piece of the best layout, in placement order."""
+        return [cells for fig_id, cells in self.placements]
+
+
+if __name__ == '__main__':
+    library = BlockLibrary.build()
+    print(f'{len(library)} blocks written to {LIBRARY_PATH}')
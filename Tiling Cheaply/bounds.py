@@ -0,0 +1,31 @@
+def corner_cells(rows, cols):
+    """Cells of a rows x cols board whose row and column are both even."""
+    return ((rows + 1) // 2) * ((cols + 1) // 2)
+
+
+def remaining_bound(cells, corners):
+    """
+    Fewest L triminoes needed to cover `cells` empty cells, `corners` of
+    which have an even row and an even column.
+
+    No piece covers two such cells (they are 2 apart and every piece fits in a
+    2x3 box without two cells of one row 2 apart), so a + b >= corners and,
+    with 4a + 3b = cells, b >= 4*corners - cells. On top of that 3b = cells
+    (mod 4) fixes b modulo 4.
+    """
+    bound = max(0, 4 * corners - cells)
+    return bound + (3 * cells - bound) % 4
+
+
+def lower_bound(rows, cols):
+    """Proven minimum number of L triminoes for a whole rows x cols board."""
+    return remaining_bound(rows * cols, corner_cells(rows, cols))
+
+
+def corner_mask(n, width):
+    """Bitboard (rows `width` bits wide) of the even/even cells of an n x n board."""
+    mask = 0
+    for y in range(0, n, 2):
+        for x in range(0, n, 2):
+            mask |= 1 << (y * width + x)
+    return mask
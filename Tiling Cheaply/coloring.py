@@ -0,0 +1,76 @@
+import io
+
+# No piece has more than 10 unit edges on its border (S and Z; L and O have
+# 8), so it touches at most 10 others and greedy colouring never needs more
+# than 11 letters
+PALETTE = ['l','s', 'g', 'v', 'x', 'f', 'j', 'k', 'i', 't', 'r']
+
+
+def color_pieces(rows, cols, pieces):
+    """
+    Letter of every piece, straight from the placement list.
+
+    `pieces` is a list of cell lists. The owner of every cell goes into one
+    flat list, each cell is compared with its right and lower neighbour to
+    collect the touching pieces, and the pieces are coloured greedily in
+    placement order. Everything is linear in the number of cells.
+    Returns the owner list (row-major) and the letter per piece.
+    """
+    owner = [-1] * (rows * cols)
+    for index, cells in enumerate(pieces):
+        for y, x in cells:
+            owner[y * cols + x] = index
+
+    touching = [[] for _ in pieces]
+    for y in range(rows):
+        base = y * cols
+        for i in range(base, base + cols):
+            a = owner[i]
+            if i + 1 < base + cols and owner[i + 1] != a:
+                touching[a].append(owner[i + 1])
+                touching[owner[i + 1]].append(a)
+            if i + cols < rows * cols and owner[i + cols] != a:
+                touching[a].append(owner[i + cols])
+                touching[owner[i + cols]].append(a)
+
+    letters = [None] * len(pieces)
+    for index, others in enumerate(touching):
+        used = {letters[other] for other in others}
+        for letter in PALETTE:
+            if letter not in used:
+                letters[index] = letter
+                break
+        else:
+            raise ValueError(f"Ran out of colors for piece {index}!")
+    return owner, letters
+
+
+def write_tiling(outfile, rows, cols, pieces):
+    """Write NO, or YES and the bitmap one row at a time, for a list of pieces or None."""
+    if pieces is None:
+        outfile.write('NO\n')
+        return
+    owner, letters = color_pieces(rows, cols, pieces)
+    outfile.write('YES\n')
+    for y in range(rows):
+        outfile.write(''.join([letters[piece] for piece in owner[y * cols:(y + 1) * cols]]))
+        outfile.write('\n')
+
+
+class TilingOutput:
+    """
+    get_solution and write_solution for a solver with solve() -> (layout, cost)
+    and pieces(), the cell lists of the layout it found.
+    """
+    def write_solution(self, outfile):
+        """Solve and stream the answer to outfile, coloured from the placements."""
+        layout, cost = self.solve()
+        if layout:
+            write_tiling(outfile, len(layout), len(layout[0]), self.pieces())
+        else:
+            write_tiling(outfile, 0, 0, None)
+
+    def get_solution(self):
+        buffer = io.StringIO()
+        self.write_solution(buffer)
+        return buffer.getvalue()
@@ -0,0 +1,183 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitboard import BitPiece
+from bounds import lower_bound, remaining_bound
+from coloring import TilingOutput
+
+
+class DLXPuzzle(TilingOutput):
+    """
+    Tiling as exact cover, solved with Dancing Links (Algorithm X).
+
+    There is one column per cell and one row per placement of a distinct
+    rotation inside the board, carrying its L cost. Instead of the first
+    empty cell in raster order, every node covers the column with the fewest
+    rows left (ties go to the first cell). The search is branch and bound on
+    the total cost: a node is cut when its cost plus the colouring bound of
+    the uncovered cells cannot beat best_cost, and it stops at the first
+    layout that meets lower_bound(n, n).
+
+    The links live in flat int lists (node 0 is the root, nodes 1..n*n the
+    column headers) so that cover/uncover only touch list items.
+    """
+    def __init__(self, n, use_bound=True):
+        self.n = n
+        self.use_bound = use_bound
+        self.best_cost = 9999
+        self.best_layout = None
+        self.best_placements = None
+        self.target = lower_bound(n, n) if use_bound else -1
+        self.placements = []
+        self.nodes = 0
+        self.empty_cells = n * n
+        self.empty_corners = ((n + 1) // 2) ** 2
+
+        cols = n * n
+        self.left = list(range(-1, cols))
+        self.right = list(range(1, cols + 2))
+        self.left[0], self.right[cols] = cols, 0
+        self.up = list(range(cols + 1))
+        self.down = list(range(cols + 1))
+        self.column = list(range(cols + 1))
+        self.size = [0] * (cols + 1)
+        self.row_of = [-1] * (cols + 1)
+
+        # Cheap pieces first, as in Puzzle (O, Z, S, L)
+        self.rows = []
+        for piece in [BitPiece(i, n) for i in range(4)][::-1]:
+            for figure in piece.possible_pos:
+                y0, x0 = figure[0]
+                offsets = [(y - y0, x - x0) for y, x in figure]
+                for y in range(n):
+                    for x in range(n):
+                        cells = [(y + dy, x + dx) for dy, dx in offsets]
+                        if all(0 <= cy < n and 0 <= cx < n for cy, cx in cells):
+                            self.add_row(piece.cost, cells)
+
+    def add_row(self, cost, cells):
+        index = len(self.rows)
+        corners = sum(1 for y, x in cells if y % 2 == 0 and x % 2 == 0)
+        self.rows.append((cost, cells, corners))
+        first = None
+        for y, x in cells:
+            col = y * self.n + x + 1
+            node = len(self.column)
+            self.column.append(col)
+            self.row_of.append(index)
+            # Append at the bottom of the column
+            self.up.append(self.up[col])
+            self.down.append(col)
+            self.down[self.up[col]] = node
+            self.up[col] = node
+            self.size[col] += 1
+            if first is None:
+                first = node
+                self.left.append(node)
+                self.right.append(node)
+            else:
+                self.left.append(self.left[first])
+                self.right.append(first)
+                self.right[self.left[first]] = node
+                self.left[first] = node
+
+    def cover(self, col):
+        left, right, up, down = self.left, self.right, self.up, self.down
+        column, size = self.column, self.size
+        right[left[col]] = right[col]
+        left[right[col]] = left[col]
+        i = down[col]
+        while i != col:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, col):
+        left, right, up, down = self.left, self.right, self.up, self.down
+        column, size = self.column, self.size
+        i = up[col]
+        while i != col:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[col]] = col
+        left[right[col]] = col
+
+    def choose_column(self):
+        # Minimum remaining values; the first column with 0 rows is a dead end
+        right, size = self.right, self.size
+        best, best_size = None, None
+        col = right[0]
+        while col != 0:
+            if best_size is None or size[col] < best_size:
+                best, best_size = col, size[col]
+                if best_size <= 1:
+                    break
+            col = right[col]
+        return best, best_size
+
+    def solve(self):
+        self.search(current_cost = 0)
+        return self.best_layout, self.best_cost
+
+    def search(self, current_cost):
+        if self.use_bound:
+            needed = remaining_bound(self.empty_cells, self.empty_corners)
+            if current_cost + needed >= self.best_cost:
+                return False
+        elif current_cost >= self.best_cost:
+            return False
+        self.nodes += 1
+        if self.right[0] == 0:
+            self.best_layout = self.layout()
+            self.best_placements = list(self.placements)
+            self.best_cost = current_cost
+            return current_cost <= self.target
+        col, count = self.choose_column()
+        if count == 0:
+            return False
+
+        right, left, down = self.right, self.left, self.down
+        self.cover(col)
+        stop = False
+        node = down[col]
+        while node != col and not stop:
+            cost, cells, corners = self.rows[self.row_of[node]]
+            j = right[node]
+            while j != node:
+                self.cover(self.column[j])
+                j = right[j]
+            self.placements.append(cells)
+            self.empty_cells -= len(cells)
+            self.empty_corners -= corners
+            stop = self.search(current_cost + cost)
+            self.empty_cells += len(cells)
+            self.empty_corners += corners
+            self.placements.pop()
+            j = left[node]
+            while j != node:
+                self.uncover(self.column[j])
+                j = left[j]
+            node = down[node]
+        self.uncover(col)
+        return stop
+
+    def layout(self):
+        board = [[0] * self.n for _ in range(self.n)]
+        for fig_id, cells in enumerate(self.placements, start=1):
+            for y, x in cells:
+                board[y][x] = fig_id
+        return board
+
+    def pieces(self):
+        """Cells of every piece of the best layout, in placement order."""
+        return list(self.best_placements)
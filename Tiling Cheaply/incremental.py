@@ -0,0 +1,68 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from coloring import write_tiling
+from profile_dp import ProfilePuzzle
+from rectangles import RectangleTable, MAX_SIDE
+
+
+class IncrementalSolver:
+    """
+    Solves an increasing sequence of n, reusing the last layout of the same parity.
+
+    An n' x n' layout grows to n x n (n - n' even) by a frame: an n' x d strip
+    on the right and a d x n strip at the bottom, d = n - n'. Only the frame
+    is new work, taken from the rectangle table (ProfilePuzzle beyond it).
+    For even n' everything costs 0; for odd n' the strips cost d each, so
+    2n' + 1 + 2d = 2n + 1 and the grown layout is still optimal. An n with
+    no earlier layout of its parity is solved from scratch with ProfilePuzzle.
+    derived_from[n] is the n it was grown from, None for a fresh solve.
+    """
+    def __init__(self):
+        self.table = RectangleTable()
+        # parity -> (n, cost, placements); the placements list grows in place
+        self.latest = {}
+        self.derived_from = {}
+        self.costs = {}
+
+    def rectangle(self, top, left, h, w):
+        if h <= MAX_SIDE and w <= MAX_SIDE:
+            placements = self.table.placements(h, w)
+        else:
+            puzzle = ProfilePuzzle(h, w)
+            puzzle.solve()
+            placements = puzzle.placements
+        return [(fig_id, [(top + y, left + x) for y, x in cells]) for fig_id, cells in placements]
+
+    def solve(self, n):
+        """Return (cost, placements) for n, or (None, None) if it cannot be tiled."""
+        prior = self.latest.get(n % 2)
+        if prior is None or prior[0] > n:
+            puzzle = ProfilePuzzle(n)
+            layout, cost = puzzle.solve()
+            self.derived_from[n] = None
+            if layout is None:
+                self.costs[n] = None
+                return None, None
+            placements = puzzle.placements
+        else:
+            base, cost, placements = prior
+            self.derived_from[n] = base
+            d = n - base
+            if d:
+                right = self.rectangle(0, base, base, d)
+                bottom = self.rectangle(base, 0, d, n)
+                placements.extend(right)
+                placements.extend(bottom)
+                cost += sum(1 for fig_id, cells in right + bottom if fig_id == 0)
+        self.latest[n % 2] = (n, cost, placements)
+        self.costs[n] = cost
+        return cost, placements
+
+    def write_solution(self, outfile, n):
+        cost, placements = self.solve(n)
+        if placements is None:
+            write_tiling(outfile, 0, 0, None)
+        else:
+            write_tiling(outfile, n, n, [cells for fig_id, cells in placements])
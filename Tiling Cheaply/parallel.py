@@ -0,0 +1,111 @@
+import os
+import sys
+import multiprocessing
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitboard import BitPuzzle
+
+# Incumbent shared by every worker, set up by init_worker
+shared_best = None
+
+
+class SubtreePuzzle(BitPuzzle):
+    """
+    BitPuzzle that searches one subtree and prunes against the shared incumbent.
+
+    The incumbent is stored as cost * tasks + index of the subtree that found
+    it. A subtree only gives way to an equal cost found by an earlier subtree,
+    so the winner is the first optimal layout in sequential order no matter
+    which worker gets there first.
+    """
+    def __init__(self, n, index, tasks):
+        self.index = index
+        self.tasks = tasks
+        super().__init__(n, use_bound=True)
+        self.target = self.bound
+        self.found = None
+
+    @property
+    def best_cost(self):
+        cost, index = divmod(shared_best.get_obj().value, self.tasks)
+        return cost + 1 if self.index < index else cost
+
+    @best_cost.setter
+    def best_cost(self, cost):
+        self.found = cost
+        key = cost * self.tasks + self.index
+        with shared_best.get_lock():
+            if key < shared_best.value:
+                shared_best.value = key
+
+    def replay(self, prefix):
+        cost = 0
+        for pos, mask, size, price in prefix:
+            placed = mask << pos
+            self.board |= placed
+            self.empty_cells -= size
+            self.empty_corners -= (placed & self.corners).bit_count()
+            self.placements.append((pos, mask))
+            cost += price
+        return cost
+
+
+def init_worker(best):
+    global shared_best
+    shared_best = best
+
+
+def solve_subtree(args):
+    n, index, tasks, prefix = args
+    puzzle = SubtreePuzzle(n, index, tasks)
+    cost = puzzle.replay(prefix)
+    puzzle.backtrack(fig_id = len(prefix) + 1, current_cost = cost)
+    return index, puzzle.found, puzzle.best_layout, puzzle.best_placements, puzzle.nodes
+
+
+class ParallelPuzzle(BitPuzzle):
+    """
+    Branch and bound over a process pool.
+
+    The first `depth` levels of the bitboard search are expanded in the usual
+    move order into independent prefixes, one task each. Workers share the
+    incumbent through a multiprocessing.Value, so an improvement in one
+    worker prunes all the others at their next node, and the search ends
+    once a layout meets the colouring lower bound.
+    """
+    def __init__(self, n, workers=None, depth=4):
+        super().__init__(n, use_bound=True)
+        self.workers = workers or os.cpu_count()
+        self.depth = depth
+
+    def expand(self, prefix, cost):
+        board = self.board
+        pos = ((board + 1) & ~board).bit_length() - 1
+        if len(prefix) == self.depth or pos >= self.limit:
+            yield prefix
+            return
+        for figure in self.figures:
+            for mask in figure.masks:
+                placed = mask << pos
+                if board & placed:
+                    continue
+                self.board = board | placed
+                yield from self.expand(prefix + [(pos, mask, figure.size, figure.cost)],
+                                       cost + figure.cost)
+                self.board = board
+
+    def solve(self):
+        prefixes = list(self.expand([], 0))
+        tasks = len(prefixes)
+        best = multiprocessing.Value('q', 10000 * tasks)
+        jobs = [(self.n, index, tasks, prefix) for index, prefix in enumerate(prefixes)]
+        with multiprocessing.Pool(self.workers, initializer=init_worker, initargs=(best,)) as pool:
+            results = pool.map(solve_subtree, jobs, chunksize=1)
+
+        self.nodes = sum(nodes for index, found, layout, placements, nodes in results)
+        winners = [(found, index, layout, placements)
+                   for index, found, layout, placements, nodes in results if layout is not None]
+        if winners:
+            self.best_cost, index, self.best_layout, self.best_placements = \
+                min(winners, key=lambda w: (w[0], w[1]))
+        return self.best_layout, self.best_cost
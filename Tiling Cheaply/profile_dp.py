@@ -0,0 +1,153 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitboard import BitPiece
+from coloring import TilingOutput
+
+
+class ProfileDP:
+    """
+    Broken-profile DP for the cheapest tiling of one rows x cols rectangle.
+
+    The rectangle is swept cell by cell along its longer side, so the frontier
+    spans the shorter side. The state is the occupancy of the next 2*width + 2
+    cells: a piece anchored at the current cell reaches at most two rows
+    further. Every layer keeps the cheapest cost per profile plus a
+    back-pointer, so the tiling is rebuilt from the final empty profile.
+    """
+    def __init__(self, rows, cols, max_profiles=200000):
+        self.rows = rows
+        self.cols = cols
+        self.transposed = cols > rows
+        self.height, self.width = (cols, rows) if self.transposed else (rows, cols)
+        self.max_profiles = max_profiles
+        self.exact = True
+
+        # Distinct rotations from BitPiece, with offsets relative to the first
+        # cell in raster order
+        self.shapes = []
+        for fig_id in range(4):
+            piece = BitPiece(fig_id, self.width)
+            for figure, mask in zip(piece.possible_pos, piece.masks):
+                y0, x0 = figure[0]
+                offsets = [(y - y0, x - x0) for y, x in figure]
+                self.shapes.append((fig_id, piece.cost, mask, offsets,
+                                    min(dx for dy, dx in offsets),
+                                    max(dx for dy, dx in offsets),
+                                    max(dy for dy, dx in offsets)))
+
+    def solve(self):
+        """Return (cost, placements) or (None, None) if the rectangle cannot be tiled."""
+        width, height = self.width, self.height
+        layer = {0: 0}
+        parents = []
+        for pos in range(width * height):
+            y, x = divmod(pos, width)
+            nxt = {}
+            back = {}
+            for profile, cost in layer.items():
+                if profile & 1:
+                    new = profile >> 1
+                    if new not in nxt or cost < nxt[new]:
+                        nxt[new] = cost
+                        back[new] = (profile, -1)
+                    continue
+                for index, (fig_id, price, mask, offsets, lo, hi, deep) in enumerate(self.shapes):
+                    if x + lo < 0 or x + hi >= width or y + deep >= height or profile & mask:
+                        continue
+                    new = (profile | mask) >> 1
+                    if new not in nxt or cost + price < nxt[new]:
+                        nxt[new] = cost + price
+                        back[new] = (profile, index)
+            if len(nxt) > self.max_profiles:
+                # Keep the table bounded: drop the most expensive profiles
+                self.exact = False
+                keep = sorted(nxt, key=lambda p: (nxt[p], p))[:self.max_profiles]
+                nxt = {p: nxt[p] for p in keep}
+            parents.append(back)
+            layer = nxt
+            if not layer:
+                return None, None
+
+        if 0 not in layer:
+            return None, None
+        placements = []
+        profile = 0
+        for pos in range(width * height - 1, -1, -1):
+            profile, index = parents[pos][profile]
+            if index != -1:
+                fig_id, price, mask, offsets, lo, hi, deep = self.shapes[index]
+                y, x = divmod(pos, width)
+                cells = [(y + dy, x + dx) for dy, dx in offsets]
+                if self.transposed:
+                    # Transposing mirrors the piece, which turns S into Z and back
+                    cells = [(b, a) for a, b in cells]
+                    fig_id = {1: 2, 2: 1}.get(fig_id, fig_id)
+                placements.append((fig_id, cells))
+        placements.reverse()
+        return layer[0], placements
+
+
+class ProfilePuzzle(TilingOutput):
+    """
+    Cheapest tiling of an n x n (or n x m) board with ProfileDP.
+
+    A single sweep over a 150-wide board would need a 300-bit frontier, so the
+    board is cut into horizontal slabs that no piece crosses and each slab is
+    swept along its length. Every slab is 2 rows high except the first, which
+    takes the remaining parity and grows (2/3, 5, 7, ...) until it can be
+    tiled. 2-row slabs cost 0 on an even width and 2 on an odd one, which
+    makes the slab costs add up to the colouring lower bound.
+    """
+    def __init__(self, n, m=None, max_profiles=200000):
+        self.n = n
+        self.m = n if m is None else m
+        self.max_profiles = max_profiles
+        self.best_cost = None
+        self.best_layout = None
+        self.placements = None
+        self.exact = True
+        self.slab_cache = {}
+
+    def solve_slab(self, height):
+        if height not in self.slab_cache:
+            dp = ProfileDP(height, self.m, self.max_profiles)
+            self.slab_cache[height] = dp.solve()
+            self.exact = self.exact and dp.exact
+        return self.slab_cache[height]
+
+    def solve(self):
+        n, m = self.n, self.m
+        first = 2 if n % 2 == 0 else 3
+        while True:
+            first = min(first, n)
+            cost, placements = self.solve_slab(first)
+            if cost is not None or first == n:
+                break
+            first += 2
+        if cost is None:
+            return None, None
+
+        rest = (n - first) // 2
+        if rest:
+            slab_cost, slab_placements = self.solve_slab(2)
+            if slab_cost is None:
+                return None, None
+            cost += rest * slab_cost
+
+        self.placements = list(placements)
+        for k in range(rest):
+            top = first + 2 * k
+            self.placements.extend((fig_id, [(y + top, x) for y, x in cells])
+                                   for fig_id, cells in slab_placements)
+        self.best_cost = cost
+        self.best_layout = [[0] * m for _ in range(n)]
+        for fig_id, (piece, cells) in enumerate(self.placements, start=1):
+            for y, x in cells:
+                self.best_layout[y][x] = fig_id
+        return self.best_layout, self.best_cost
+
+    def pieces(self):
+        """Cells of every piece of the best layout, in placement order."""
+        return [cells for fig_id, cells in self.placements]
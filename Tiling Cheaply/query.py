@@ -0,0 +1,55 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from blocks import BlockPuzzle
+from bounds import lower_bound
+from profile_dp import ProfilePuzzle
+from rectangles import RectanglePuzzle, MAX_SIDE
+
+MAX_N = 10 ** 6
+
+
+def tiling_cost(n, m=None):
+    """
+    Minimum number of L triminoes for an n x m board (m defaults to n), or
+    None if the board cannot be tiled. O(1), no search and no table.
+
+    The colouring bound is always reached when a tiling exists (checked by the
+    rectangle table up to 150 x 150 and by the block construction for every
+    square), and a tiling exists exactly when both sides are at least 2 and
+    the bound fits in the board: 3 * bound <= n * m. For squares that is
+    0 for even n, 2n + 1 for odd n >= 7 and None for n = 1, 3, 5.
+    """
+    m = n if m is None else m
+    if not (1 <= n <= MAX_N and 1 <= m <= MAX_N):
+        raise ValueError(f"Board {n}x{m} is outside 1..{MAX_N}!")
+    if n < 2 or m < 2:
+        return None
+    cost = lower_bound(n, m)
+    return cost if 3 * cost <= n * m else None
+
+
+def has_tiling(n, m=None):
+    return tiling_cost(n, m) is not None
+
+
+def query(n, m=None, bitmap=False):
+    """
+    (exists, cost, solution) for an n x m board. solution is the YES/NO text
+    of get_solution and is only built when bitmap=True: O(n^2) from the block
+    library for squares, from the rectangle table for other boards up to
+    MAX_SIDE x MAX_SIDE, and from ProfilePuzzle slabs when a side is longer.
+    """
+    cost = tiling_cost(n, m)
+    m = n if m is None else m
+    solution = None
+    if bitmap:
+        if m == n:
+            puzzle = BlockPuzzle(n)
+        elif n <= MAX_SIDE and m <= MAX_SIDE:
+            puzzle = RectanglePuzzle(n, m)
+        else:
+            puzzle = ProfilePuzzle(n, m)
+        solution = puzzle.get_solution()
+    return cost is not None, cost, solution
@@ -0,0 +1,153 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from blocks import BlockPuzzle, BLOCK_SIDES
+from bounds import lower_bound
+from coloring import TilingOutput
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rectangles.npz')
+MAX_SIDE = 150
+NO_TILING = -1
+
+
+def build_table(max_side=MAX_SIDE, library=None):
+    """
+    Minimum L count and split recipe for every m x n rectangle, m, n <= max_side.
+
+    cost[m, n] is NO_TILING if the rectangle cannot be tiled. split[m, n] is 0
+    for a library block, k > 0 for a cut below row k and -k for a cut right
+    of column k. Rectangles are filled row by row, so both halves of a cut
+    are already known; a cut is only taken when it beats the block (ties go
+    to the block, then to the first cut).
+    """
+    library = library or BlockPuzzle.library
+    big = np.iinfo(np.int32).max // 4
+    cost = np.full((max_side + 1, max_side + 1), big, dtype=np.int32)
+    split = np.zeros((max_side + 1, max_side + 1), dtype=np.int16)
+    for m in range(1, max_side + 1):
+        for n in range(1, max_side + 1):
+            best, recipe = big, 0
+            if m in BLOCK_SIDES and n in BLOCK_SIDES and library.has(m, n):
+                best = library.get(m, n)[0]
+            if m > 1:
+                cuts = cost[1:m // 2 + 1, n] + cost[m - 1:m - m // 2 - 1:-1, n]
+                k = int(np.argmin(cuts))
+                if cuts[k] < best:
+                    best, recipe = int(cuts[k]), k + 1
+            if n > 1:
+                cuts = cost[m, 1:n // 2 + 1] + cost[m, n - 1:n - n // 2 - 1:-1]
+                k = int(np.argmin(cuts))
+                if cuts[k] < best:
+                    best, recipe = int(cuts[k]), -(k + 1)
+            cost[m, n] = best
+            split[m, n] = recipe
+    cost[cost >= big] = NO_TILING
+    return cost.astype(np.int16), split
+
+
+class RectangleTable:
+    """
+    The build_table arrays for m, n <= 150, stored in rectangles.npz (int16).
+
+    Loaded on first use and checked against the colouring bound: a tileable
+    rectangle must cost exactly lower_bound(m, n) and every cut must split it
+    into two tileable halves.
+    """
+    def __init__(self, path=TABLE_PATH):
+        self.path = path
+        self.cost = None
+        self.split = None
+        # The library BlockPuzzle already loads, so blocks.json is read and checked once
+        self.library = BlockPuzzle.library
+
+    def load(self):
+        with np.load(self.path) as data:
+            cost, split = data['cost'], data['split']
+        size = cost.shape[0] - 1
+        if cost.shape != (size + 1, size + 1) or split.shape != cost.shape:
+            raise ValueError(f"Rectangle table has shapes {cost.shape} and {split.shape}!")
+        for m in range(1, size + 1):
+            for n in range(1, size + 1):
+                c, k = int(cost[m, n]), int(split[m, n])
+                if c == NO_TILING:
+                    continue
+                if c != lower_bound(m, n):
+                    raise ValueError(f"Rectangle {m}x{n} costs {c}, expected {lower_bound(m, n)}!")
+                if k > 0:
+                    halves = cost[k, n], cost[m - k, n]
+                elif k < 0:
+                    halves = cost[m, -k], cost[m, n + k]
+                else:
+                    halves = (c,) if self.library.has(m, n) else (NO_TILING,)
+                if NO_TILING in halves or sum(halves) != c:
+                    raise ValueError(f"Rectangle {m}x{n} has a broken recipe {k}!")
+        self.cost, self.split = cost, split
+
+    def save(self):
+        np.savez_compressed(self.path, cost=self.cost, split=self.split)
+
+    def lookup(self, m, n):
+        """Minimum L count of an m x n board, None if it cannot be tiled."""
+        if self.cost is None:
+            self.load()
+        c = int(self.cost[m, n])
+        return None if c == NO_TILING else c
+
+    def placements(self, m, n):
+        """(fig_id, cells) of an optimal m x n tiling, rebuilt from the recipe."""
+        if self.lookup(m, n) is None:
+            return None
+        placements = []
+        stack = [(0, 0, m, n)]
+        while stack:
+            top, left, h, w = stack.pop()
+            k = int(self.split[h, w])
+            if k > 0:
+                stack.append((top + k, left, h - k, w))
+                stack.append((top, left, k, w))
+            elif k < 0:
+                stack.append((top, left - k, h, w + k))
+                stack.append((top, left, h, -k))
+            else:
+                for fig_id, cells in self.library.get(h, w)[1]:
+                    placements.append((fig_id, [(top + y, left + x) for y, x in cells]))
+        return placements
+
+
+class RectanglePuzzle(TilingOutput):
+    """Cheapest n x m tiling (m defaults to n) from the rectangle table."""
+    table = RectangleTable()
+
+    def __init__(self, n, m=None):
+        self.n = n
+        self.m = n if m is None else m
+        self.best_cost = 9999
+        self.best_layout = None
+        self.placements = None
+
+    def solve(self):
+        self.placements = self.table.placements(self.n, self.m)
+        if self.placements is None:
+            return None, self.best_cost
+        layout = [[0] * self.m for _ in range(self.n)]
+        for fig_id, (piece, cells) in enumerate(self.placements, start=1):
+            for y, x in cells:
+                layout[y][x] = fig_id
+        self.best_layout = layout
+        self.best_cost = self.table.lookup(self.n, self.m)
+        return self.best_layout, self.best_cost
+
+    def pieces(self):
+        """Cells of every piece of the best layout, in placement order."""
+        return [cells for fig_id, cells in self.placements]
+
+
+if __name__ == '__main__':
+    table = RectangleTable()
+    table.cost, table.split = build_table()
+    table.save()
+    tiled = int((table.cost[1:, 1:] != NO_TILING).sum())
+    print(f'{tiled} of {MAX_SIDE * MAX_SIDE} rectangles can be tiled, table written to {TABLE_PATH}')
@@ -0,0 +1,111 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitboard import BitPuzzle
+
+
+class StackPuzzle(BitPuzzle):
+    """
+    BitPuzzle search without recursion.
+
+    Every open level of the search is a frame (anchor cell, next move, cost,
+    empty cells, empty corners), where the moves are the (piece, rotation)
+    pairs in the usual order. The frame being worked on lives in local
+    variables; a child frame replaces it and its parent goes on the stack.
+    There is a single board: a placement is ORed in on the way down, and
+    going back XORs the popped placement out and restores the parent.
+    There is no Python frame per piece, so n=150 needs no recursion limit,
+    and run(budget) can stop after any number of nodes and carry on later
+    from the same stack.
+    """
+    def __init__(self, n, use_bound=False):
+        super().__init__(n, use_bound)
+        moves = [(figure, mask) for figure in self.figures for mask in figure.masks]
+        self.masks = [mask for figure, mask in moves]
+        self.sizes = [figure.size for figure, mask in moves]
+        self.costs = [figure.cost for figure, mask in moves]
+        self.stack = []
+        self.frame = None
+        self.done = False
+
+    def solve(self):
+        while not self.run():
+            pass
+        return self.best_layout, self.best_cost
+
+    def solve_optimal(self):
+        self.target = self.bound if self.use_bound else -1
+        return self.solve()
+
+    def run(self, budget=None):
+        """Search for up to `budget` nodes. Returns True once the search has ended."""
+        if self.done:
+            return True
+        if self.frame is None:
+            # Root node
+            self.nodes += 1
+            board = self.board
+            self.frame = (((board + 1) & ~board).bit_length() - 1, 0, 0,
+                          self.empty_cells, self.empty_corners)
+
+        stack, placements = self.stack, self.placements
+        masks, sizes, costs = self.masks, self.sizes, self.costs
+        count = len(masks)
+        corner_mask, limit, target, use_bound = self.corners, self.limit, self.target, self.use_bound
+        nodes, best_cost = self.nodes, self.best_cost
+        stop = None if budget is None else nodes + budget
+        board = self.board
+        pos, k, cost, cells, corners = self.frame
+        while True:
+            if stop is not None and nodes >= stop:
+                break
+            while k < count and board & (masks[k] << pos):
+                k += 1
+            if k == count:
+                if not stack:
+                    self.done = True
+                    break
+                last_pos, last_mask = placements.pop()
+                board ^= last_mask << last_pos
+                pos, k, cost, cells, corners = stack.pop()
+                continue
+
+            # One node: the work at the top of BitPuzzle.backtrack
+            mask = masks[k]
+            placed = mask << pos
+            child_cells = cells - sizes[k]
+            child_corners = corners - (placed & corner_mask).bit_count()
+            child_cost = cost + costs[k]
+            k += 1
+            if use_bound:
+                # bounds.remaining_bound, inlined as in BitPuzzle.backtrack
+                needed = 4 * child_corners - child_cells
+                if needed < 0:
+                    needed = 0
+                needed += (3 * child_cells - needed) % 4
+                if child_cost + needed >= best_cost:
+                    continue
+            elif child_cost >= best_cost:
+                continue
+            nodes += 1
+            placements.append((pos, mask))
+            board |= placed
+            child_pos = ((board + 1) & ~board).bit_length() - 1
+            if child_pos >= limit:
+                self.best_layout = self.layout()
+                self.best_placements = list(placements)
+                best_cost = self.best_cost = child_cost
+                if child_cost <= target:
+                    self.done = True
+                    break
+                placements.pop()
+                board ^= placed
+                continue
+            stack.append((pos, k, cost, cells, corners))
+            pos, k, cost, cells, corners = child_pos, 0, child_cost, child_cells, child_corners
+
+        self.frame = (pos, k, cost, cells, corners)
+        self.board, self.empty_cells, self.empty_corners = board, cells, corners
+        self.nodes = nodes
+        return self.done
@@ -0,0 +1,46 @@
+class BoardSymmetry:
+    """
+    The 8 rotations/reflections of an n x n board, for memo keys and corner pruning.
+
+    images[k] is the occupancy of the k-th image of the board, kept up to
+    date by toggle(). Pieces compare by (L cost, sorted cells). corner_key
+    is the piece at (0,0) once it is placed: a piece covering another corner
+    is only placed if, moved onto (0,0) by a symmetry, it does not sort
+    before corner_key. Every tiling has an image that passes this check.
+    The prune depends on corner_key, so key() holds it next to the smallest
+    image. Two boards share an entry only when their subtrees are cut the same way.
+    """
+    def __init__(self, n):
+        m = n - 1
+        self.transforms = [lambda y, x: (y, x), lambda y, x: (x, y),
+                           lambda y, x: (m - y, x), lambda y, x: (y, m - x),
+                           lambda y, x: (m - y, m - x), lambda y, x: (x, m - y),
+                           lambda y, x: (m - x, y), lambda y, x: (m - x, m - y)]
+        # Bit of every cell in each of the 8 images of the board
+        self.image_bits = [[1 << (ty * n + tx) for ty, tx in
+                            (t(y, x) for y in range(n) for x in range(n))]
+                           for t in self.transforms]
+        self.images = [0] * 8
+        self.corners = {(0, m), (m, 0), (m, m)}
+        self.corner_key = None
+
+    def toggle(self, cell):
+        for k, bits in enumerate(self.image_bits):
+            self.images[k] ^= bits[cell]
+
+    def key(self):
+        return min(self.images), self.corner_key
+
+    def breaks_symmetry(self, cost, cells):
+        # An O at (0,0) is never beaten, so the first layouts the search
+        # tries are not cut
+        if self.corner_key is None:
+            # Piece at (0,0): the transpose is the only other symmetry fixing it
+            return (0, 0) in cells and sorted((cx, cy) for cy, cx in cells) < sorted(cells)
+        if self.corners.isdisjoint(cells):
+            return False
+        for t in self.transforms:
+            image = tuple(sorted(t(cy, cx) for cy, cx in cells))
+            if image[0] == (0, 0) and (cost, image) < self.corner_key:
+                return True
+        return False
@@ -0,0 +1,58 @@
+from collections import OrderedDict, defaultdict
+
+
+class TranspositionTable:
+    """
+    Memo of the cheapest cost seen per board occupancy, with an entry budget.
+
+    The key is the occupancy bitmask alone: the filled prefix is implied by
+    next_empty, and the piece numbering does not change what can still be
+    placed. When the table is full it evicts either the least recently used
+    entry ('lru') or an entry with the fewest empty cells left, i.e. the
+    smallest subtree behind it ('depth').
+    """
+    def __init__(self, capacity=1000000, policy='lru'):
+        if policy not in ('lru', 'depth'):
+            raise ValueError(f"Unknown eviction policy {policy}!")
+        self.capacity = capacity
+        self.policy = policy
+        self.entries = OrderedDict()
+        self.by_depth = defaultdict(set)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        cost = self.entries.get(key)
+        if cost is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            if self.policy == 'lru':
+                self.entries.move_to_end(key)
+        return cost
+
+    def store(self, key, cost, depth):
+        if key not in self.entries:
+            if len(self.entries) >= self.capacity:
+                self.evict()
+            if self.policy == 'depth':
+                self.by_depth[depth].add(key)
+        self.entries[key] = cost
+        if self.policy == 'lru':
+            self.entries.move_to_end(key)
+
+    def evict(self):
+        if self.policy == 'lru':
+            self.entries.popitem(last=False)
+        else:
+            deepest = max(d for d, keys in self.by_depth.items() if keys)
+            del self.entries[self.by_depth[deepest].pop()]
+        self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.by_depth.clear()
+
+    def stats(self):
+        return f'memo hits={self.hits} misses={self.misses} evictions={self.evictions} size={len(self.entries)}'
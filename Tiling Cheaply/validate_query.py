@@ -0,0 +1,24 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from profile_dp import ProfileDP
+from query import query, tiling_cost, MAX_N
+
+# Exact whole-board DP, independent of the colouring bound
+print(f'{"n":>3} {"query":>6} {"search":>7} {"bitmap":>7} {"seconds":>8}')
+for n in range(1, 13):
+    start = time.perf_counter()
+    dp = ProfileDP(n, n, max_profiles=10 ** 7)
+    cost, placements = dp.solve()
+    assert dp.exact
+    exists, answer, solution = query(n, bitmap=True)
+    assert answer == cost, (n, answer, cost)
+    assert solution.startswith('YES') == exists
+    print(f'{n:>3} {str(answer):>6} {str(cost):>7} {solution.split()[0]:>7} {time.perf_counter() - start:>8.2f}')
+
+start = time.perf_counter()
+tiled = sum(1 for n in range(1, MAX_N + 1) if tiling_cost(n) is not None)
+elapsed = time.perf_counter() - start
+print(f'{MAX_N} queries in {elapsed:.2f} s, {tiled} boards can be tiled')